@@ -1,7 +1,10 @@
 import aiohttp
+import asyncio
+import heapq
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import time
 from ..oauth.client import BoltOAuthClient
 from ..utils.database import FleetDatabase
@@ -21,13 +24,24 @@ class BoltFleetClient:
         self.session = None
         self._companies = None
         self.db = FleetDatabase()
+        # Stats aggregation iterates up to 1000 state logs plus SQLite reads;
+        # run it in a thread pool so it doesn't stall the gateway heartbeat
+        self._stats_executor = ThreadPoolExecutor(max_workers=2)
 
-    async def __aenter__(self):
-        self.session = None  # We don't use aiohttp
+    async def start(self):
+        """One-time client setup; call once from the bot's setup_hook.
 
+        Replaces the old per-command `async with` pattern - the client is
+        long-lived for the bot session, so there is nothing to tear down
+        between commands.
+        """
         # Auto-fetch company ID if not provided
         if not self.company_id:
             await self._auto_set_company_id()
+
+    async def __aenter__(self):
+        self.session = None  # We don't use aiohttp
+        await self.start()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -237,6 +251,33 @@ class BoltFleetClient:
             logger.error(f"Failed to fetch fleet state logs: {e}")
             raise
 
+    async def iter_fleet_state_logs(self,
+                                    start_date: Optional[datetime] = None,
+                                    end_date: Optional[datetime] = None,
+                                    page_size: int = 500):
+        """Yield fleet state logs page by page until the range is exhausted.
+
+        Callers can process each page as it arrives instead of holding one
+        capped 1000-row response; a short page marks the end of the range.
+        """
+        offset = 0
+        while True:
+            response = await self.get_fleet_state_logs(
+                start_date=start_date,
+                end_date=end_date,
+                limit=page_size,
+                offset=offset
+            )
+            if response.get("code") != 0:
+                break
+            page = response.get("data", {}).get("state_logs", [])
+            if not page:
+                break
+            yield page
+            if len(page) < page_size:
+                break
+            offset += page_size
+
     async def get_state_logs_for_period(self, driver_uuid: str, days: int) -> List[Dict]:
         """
         Get state logs for a specific period, handling API limitations and date logic
@@ -304,8 +345,22 @@ class BoltFleetClient:
         else:
             logger.info(f"Skipping state logs for {'all time' if not days else f'{days} days'} (too long for API)")
 
-        # Get driver stats with or without state logs
-        return self.db.get_driver_stats_by_uuid(driver_uuid, days, state_logs)
+        # Get driver stats with or without state logs (off the event loop)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._stats_executor,
+            self.db.get_driver_stats_by_uuid,
+            driver_uuid, days, state_logs
+        )
+
+    async def get_company_earnings(self, start_date, end_date):
+        """Get company earnings for a date range without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._stats_executor,
+            self.db.get_company_earnings_by_date_range,
+            start_date, end_date
+        )
 
     # Helper methods to process responses
     async def get_trip_data(self, **kwargs):
@@ -384,7 +439,8 @@ class BoltFleetClient:
                         ride_price = order_price.get('ride_price', 0) or 0
                         weekly_earnings[week_key] += ride_price
 
-                for week, earnings in sorted(weekly_earnings.items(), reverse=True)[:4]:
+                # Top 4 weeks without sorting the whole history
+                for week, earnings in heapq.nlargest(4, weekly_earnings.items()):
                     weekly_breakdown.append({
                         'week_start': week,
                         'earnings': earnings
@@ -501,6 +557,6 @@ class BoltFleetClient:
             logger.error(f"Failed to fetch fleet statistics: {e}")
             raise
 
-    async def sync_database(self, full_sync: bool = False) -> Dict[str, Any]:
+    async def sync_database(self, full_sync: bool = False, batch_size: int = 500) -> Dict[str, Any]:
         """Sync orders from API to local database"""
-        return await self.db.sync_orders(self, full_sync=full_sync)
\ No newline at end of file
+        return await self.db.sync_orders(self, full_sync=full_sync, batch_size=batch_size)
\ No newline at end of file
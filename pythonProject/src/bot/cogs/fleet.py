@@ -1,70 +1,228 @@
+import asyncio
+
 import discord
 from discord.ext import commands
 from discord import ui
-from datetime import datetime, timedelta, date
+from collections import OrderedDict
+from datetime import datetime, timedelta, date, timezone
+from discord.utils import utcnow
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 from typing import Optional, List, Tuple
 import calendar
 import logging
+import time
+
+from ...utils.timing import timed, track
 
 logger = logging.getLogger(__name__)
 
 # Company start date - no data before this
-COMPANY_START_DATE = datetime(2025, 7, 28)
+COMPANY_START_DATE = datetime(2025, 7, 28, tzinfo=timezone.utc)
+
+# All reporting periods are defined in Romania local time
+ROMANIA_TZ = ZoneInfo("Europe/Bucharest")
+UTC = timezone.utc
+
+# Precomputed name tables; indexing these beats strftime's locale handling
+# in the per-button label loops
+DAY_ABBR = tuple(calendar.day_abbr)
+MONTH_NAMES = tuple(calendar.month_name)[1:]
+MONTH_ABBR = tuple(calendar.month_abbr)[1:]
+
+
+def _hm(hours: float) -> Tuple[int, int]:
+    """Split fractional hours into (h, m) via one divmod.
+
+    Rounding to whole minutes first avoids the float-subtraction path
+    that could render e.g. 2.9999 hours as 2h 59m.
+    """
+    return divmod(int(round(hours * 60)), 60)
+
+
+def _short_date(d: date) -> str:
+    """Equivalent of strftime('%b %d') without the strftime call"""
+    return f"{MONTH_ABBR[d.month - 1]} {d.day:02d}"
+
+
+def _prev_month(dt: date) -> date:
+    """First day of the month before dt's month"""
+    y, m = (dt.year - 1, 12) if dt.month == 1 else (dt.year, dt.month - 1)
+    return dt.replace(year=y, month=m, day=1)
+
+
+def _next_month(dt: date) -> date:
+    """First day of the month after dt's month"""
+    y, m = (dt.year + 1, 1) if dt.month == 12 else (dt.year, dt.month + 1)
+    return dt.replace(year=y, month=m, day=1)
+
+
+@lru_cache(maxsize=512)
+def _month_bounds_utc(year: int, month: int) -> Tuple[datetime, datetime]:
+    """UTC [start, end) boundaries of a Romania-local calendar month.
+
+    Pure function of (year, month); caching it turns the repeated
+    tz-conversion work on month-view clicks into a dict lookup.
+    """
+    local_start = datetime(year, month, 1, tzinfo=ROMANIA_TZ)
+    next_y, next_m = (year + 1, 1) if month == 12 else (year, month + 1)
+    local_end = datetime(next_y, next_m, 1, tzinfo=ROMANIA_TZ)
+    return local_start.astimezone(UTC), local_end.astimezone(UTC)
+
+
+@lru_cache(maxsize=512)
+def _year_bounds_utc(year: int) -> Tuple[datetime, datetime]:
+    """UTC [start, end) boundaries of a Romania-local calendar year"""
+    local_start = datetime(year, 1, 1, tzinfo=ROMANIA_TZ)
+    local_end = datetime(year + 1, 1, 1, tzinfo=ROMANIA_TZ)
+    return local_start.astimezone(UTC), local_end.astimezone(UTC)
+
+
+@lru_cache(maxsize=512)
+def _week_start(year: int, month: int, day: int) -> date:
+    """Monday of the week containing the given date"""
+    d = date(year, month, day)
+    return d - timedelta(days=d.weekday())
+
+
+@lru_cache(maxsize=512)
+def _weeks_in_month(year: int, month: int) -> Tuple[Tuple[date, date], ...]:
+    """All weeks (Mon-Sun) that overlap with the month.
+
+    Pure function of (year, month), so repeated month navigation hits the
+    cache instead of re-running the timedelta loop.
+    """
+    first_day = date(year, month, 1)
+    # Find the Monday of that week
+    week_start = first_day - timedelta(days=first_day.weekday())
+
+    # Get last day of month
+    last_day = date(year, month, calendar.monthrange(year, month)[1])
+
+    # Collect all weeks that overlap with this month
+    weeks = []
+    while week_start <= last_day:
+        weeks.append((week_start, week_start + timedelta(days=6)))
+        week_start += timedelta(days=7)
+
+    return tuple(weeks)
+
+
+# Local bindings for the button-style enum members used in the redraw loops
+_BTN_PRI = discord.ButtonStyle.primary
+_BTN_SEC = discord.ButtonStyle.secondary
+_BTN_OK = discord.ButtonStyle.success
+_BTN_ERR = discord.ButtonStyle.danger
 
 
 def in_channel(channel_ids: list[int]):
+    allowed = frozenset(channel_ids)
+
     def predicate(ctx):
-        return ctx.channel.id in channel_ids
+        return ctx.channel.id in allowed
     return commands.check(predicate)
 
 
 class CalendarNavigationView(ui.View):
     """Base view for calendar navigation"""
 
+    _min_ord = COMPANY_START_DATE.toordinal()
+
     def __init__(self, callback_func, driver_uuid: str = None, driver_name: str = None, timeout: int = 180):
         super().__init__(timeout=timeout)
         self.callback_func = callback_func
         self.driver_uuid = driver_uuid
         self.driver_name = driver_name
-        self.current_date = datetime.now()
+        self._max_ord = utcnow().toordinal()
+        self._defer_tasks = set()
+
+    async def _auto_defer(self, interaction: discord.Interaction):
+        """Defer just before Discord's 3s deadline if a callback forgot to"""
+        await asyncio.sleep(2.5)
+        if not interaction.response.is_done() and not interaction.is_expired():
+            await interaction.response.defer()
 
-    def check_date_limits(self, check_date: datetime) -> bool:
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Runs before every component callback on the view, so a slow
+        # branch that misses its manual defer can't fail the interaction
+        task = asyncio.create_task(self._auto_defer(interaction))
+        self._defer_tasks.add(task)
+        task.add_done_callback(self._defer_tasks.discard)
+        return True
+
+    def _refresh_window(self):
+        """Snapshot today's bound once per redraw instead of per check"""
+        self._max_ord = utcnow().toordinal()
+
+    def check_date_limits(self, check_date: date) -> bool:
         """Check if date is within valid range"""
-        return COMPANY_START_DATE <= check_date <= datetime.now()
+        return self._min_ord <= check_date.toordinal() <= self._max_ord
 
 
 class InitialSelectView(CalendarNavigationView):
     """Initial view for selecting time period type"""
 
-    @ui.button(label="📅 Day", style=discord.ButtonStyle.primary, row=0)
+    # Set by _get_initial_view so the cache entry can evict itself
+    _cache_key = None
+
+    def _evict_from_cache(self):
+        if self._cache_key is not None and _initial_view_cache.get(self._cache_key) is self:
+            del _initial_view_cache[self._cache_key]
+
+    async def on_timeout(self):
+        self._evict_from_cache()
+
+    def stop(self):
+        self._evict_from_cache()
+        super().stop()
+
+    @ui.button(label="📅 Day", style=_BTN_PRI, row=0)
     async def day_view(self, interaction: discord.Interaction, button: ui.Button):
-        await interaction.response.defer()
         view = DaySelectView(self.callback_func, self.driver_uuid, self.driver_name)
-        await interaction.edit_original_response(view=view)
+        await interaction.response.edit_message(view=view)
 
-    @ui.button(label="📆 Week", style=discord.ButtonStyle.primary, row=0)
+    @ui.button(label="📆 Week", style=_BTN_PRI, row=0)
     async def week_view(self, interaction: discord.Interaction, button: ui.Button):
-        await interaction.response.defer()
         view = WeekSelectView(self.callback_func, self.driver_uuid, self.driver_name)
-        await interaction.edit_original_response(view=view)
+        await interaction.response.edit_message(view=view)
 
-    @ui.button(label="📊 Month", style=discord.ButtonStyle.primary, row=0)
+    @ui.button(label="📊 Month", style=_BTN_PRI, row=0)
     async def month_view(self, interaction: discord.Interaction, button: ui.Button):
-        await interaction.response.defer()
         view = MonthSelectView(self.callback_func, self.driver_uuid, self.driver_name)
-        await interaction.edit_original_response(view=view)
+        await interaction.response.edit_message(view=view)
 
-    @ui.button(label="📈 Year", style=discord.ButtonStyle.primary, row=0)
+    @ui.button(label="📈 Year", style=_BTN_PRI, row=0)
     async def year_view(self, interaction: discord.Interaction, button: ui.Button):
-        await interaction.response.defer()
         view = YearSelectView(self.callback_func, self.driver_uuid, self.driver_name)
-        await interaction.edit_original_response(view=view)
+        await interaction.response.edit_message(view=view)
 
-    @ui.button(label="🎯 Custom", style=discord.ButtonStyle.success, row=0)
+    @ui.button(label="🎯 Custom", style=_BTN_OK, row=0)
     async def custom_view(self, interaction: discord.Interaction, button: ui.Button):
-        await interaction.response.defer()
         view = CustomDateSelectView(self.callback_func, self.driver_uuid, self.driver_name)
-        await interaction.edit_original_response(view=view)
+        await interaction.response.edit_message(view=view)
+
+
+# One reusable InitialSelectView per (callback, driver) for Back navigation
+_initial_view_cache = {}
+
+
+def _get_initial_view(callback_func, driver_uuid=None, driver_name=None) -> InitialSelectView:
+    """Return a cached InitialSelectView, rebuilding only if it timed out.
+
+    Back is the hottest navigation path and the initial view's content is
+    identical every time, so reconstructing it (and its five buttons) per
+    click is pure allocation churn. Keyed on the underlying function —
+    bound methods are fresh objects per invocation, so their id() would
+    never repeat across sessions — and entries evict themselves when the
+    view stops or times out, so the dict stays at one live entry per
+    (command, driver)."""
+    key = (getattr(callback_func, '__func__', callback_func), driver_uuid)
+    view = _initial_view_cache.get(key)
+    if view is None or view.is_finished():
+        view = InitialSelectView(callback_func, driver_uuid, driver_name)
+        view._cache_key = key
+        _initial_view_cache[key] = view
+    return view
 
 
 class DaySelectView(CalendarNavigationView):
@@ -72,96 +230,98 @@ class DaySelectView(CalendarNavigationView):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.current_week_start = self._get_week_start(datetime.now())
-        self._update_buttons()
+        self.current_week_start = self._get_week_start(utcnow())
+        self._build_buttons()
 
-    def _get_week_start(self, dt: datetime) -> datetime:
+    def _get_week_start(self, dt) -> date:
         """Get Monday of the week for given date"""
-        days_since_monday = dt.weekday()
-        return dt - timedelta(days=days_since_monday)
-
-    def _update_buttons(self):
-        """Update button labels and states based on current week"""
-        self.clear_items()
+        return _week_start(dt.year, dt.month, dt.day)
 
+    def _build_buttons(self):
+        """Create the fixed button layout once; navigation mutates in place"""
         # Navigation row
-        prev_week = self.current_week_start - timedelta(days=7)
-        next_week = self.current_week_start + timedelta(days=7)
-
-        # Previous week button
-        prev_button = ui.Button(label="◀", style=discord.ButtonStyle.secondary, row=0)
-        prev_button.disabled = not self.check_date_limits(prev_week)
-        prev_button.callback = self.prev_week
-        self.add_item(prev_button)
+        self._prev_button = ui.Button(label="◀", style=_BTN_SEC, row=0)
+        self._prev_button.callback = self.prev_week
+        self.add_item(self._prev_button)
 
-        # Week range label
-        week_end = self.current_week_start + timedelta(days=6)
-        week_label = f"{self.current_week_start.strftime('%b %d')} - {week_end.strftime('%b %d, %Y')}"
-        label_button = ui.Button(label=week_label, style=discord.ButtonStyle.secondary, row=0, disabled=True)
-        self.add_item(label_button)
+        self._label_button = ui.Button(style=_BTN_SEC, row=0, disabled=True)
+        self.add_item(self._label_button)
 
-        # Next week button
-        next_button = ui.Button(label="▶", style=discord.ButtonStyle.secondary, row=0)
-        next_button.disabled = not self.check_date_limits(next_week)
-        next_button.callback = self.next_week
-        self.add_item(next_button)
+        self._next_button = ui.Button(label="▶", style=_BTN_SEC, row=0)
+        self._next_button.callback = self.next_week
+        self.add_item(self._next_button)
 
         # Day buttons (2 rows, Mon-Thu and Fri-Sun)
+        self._day_buttons = []
         for i in range(7):
-            day_date = self.current_week_start + timedelta(days=i)
-            day_name = day_date.strftime('%a')
-            day_num = day_date.strftime('%d')
-
-            # Determine button style
-            if day_date.date() == datetime.now().date():
-                style = discord.ButtonStyle.success  # Today is green
-            elif not self.check_date_limits(day_date):
-                style = discord.ButtonStyle.secondary  # Future/past dates
-            else:
-                style = discord.ButtonStyle.primary
-
-            # Place Mon-Thu on row 1, Fri-Sun on row 2
-            row = 1 if i < 4 else 2
-
-            button = ui.Button(
-                label=f"{day_name}\n{day_num}",
-                style=style,
-                row=row,
-                disabled=not self.check_date_limits(day_date)
-            )
-            button.callback = self._make_day_callback(day_date)
+            button = ui.Button(row=1 if i < 4 else 2)
+            button.callback = self._on_day_click
+            self._day_buttons.append(button)
             self.add_item(button)
 
         # Back button
-        back_button = ui.Button(label="🔙 Back", style=discord.ButtonStyle.danger, row=3)
+        back_button = ui.Button(label="🔙 Back", style=_BTN_ERR, row=3)
         back_button.callback = self.go_back
         self.add_item(back_button)
 
-    def _make_day_callback(self, day_date: datetime):
-        async def callback(interaction: discord.Interaction):
-            await interaction.response.defer()
-            # Calculate stats for the specific day
-            await self.callback_func(interaction, day_date, self.driver_uuid, view_type='day')
-            self.stop()
+        self._refresh_buttons()
 
-        return callback
+    def _refresh_buttons(self):
+        """Update button labels and states based on current week"""
+        self._refresh_window()
+
+        # One clock read per redraw; per-day checks are integer compares
+        today_ord = utcnow().toordinal()
+
+        prev_week = self.current_week_start - timedelta(days=7)
+        next_week = self.current_week_start + timedelta(days=7)
+        self._prev_button.disabled = not self.check_date_limits(prev_week)
+        self._next_button.disabled = not self.check_date_limits(next_week)
+
+        week_end = self.current_week_start + timedelta(days=6)
+        self._label_button.label = f"{_short_date(self.current_week_start)} - {_short_date(week_end)}, {week_end.year}"
+
+        for i, button in enumerate(self._day_buttons):
+            day_date = self.current_week_start + timedelta(days=i)
+
+            # Determine button style
+            if day_date.toordinal() == today_ord:
+                style = _BTN_OK  # Today is green
+            elif not self.check_date_limits(day_date):
+                style = _BTN_SEC  # Future/past dates
+            else:
+                style = _BTN_PRI
+
+            button.label = f"{DAY_ABBR[day_date.weekday()]}\n{day_date.day:02d}"
+            button.style = style
+            button.disabled = not self.check_date_limits(day_date)
+            button.custom_id = f"day:{day_date.toordinal()}"
+
+    async def _on_day_click(self, interaction: discord.Interaction):
+        # Single bound method shared by all day buttons; the clicked day is
+        # decoded from custom_id instead of being captured in a closure
+        day_date = datetime.fromordinal(int(interaction.data['custom_id'].split(':')[1]))
+        # Defer with thinking=True before the HTTP/DB work so slow
+        # queries can't run past Discord's 3-second response window
+        await interaction.response.defer(thinking=True)
+        await self.callback_func(interaction, day_date, self.driver_uuid, view_type='day')
+        self.stop()
 
     async def prev_week(self, interaction: discord.Interaction):
-        await interaction.response.defer()
         self.current_week_start -= timedelta(days=7)
-        self._update_buttons()
-        await interaction.edit_original_response(view=self)
+        self._refresh_buttons()
+        # Single UPDATE_MESSAGE callback: acks and edits in one REST call
+        await interaction.response.edit_message(view=self)
 
     async def next_week(self, interaction: discord.Interaction):
-        await interaction.response.defer()
         self.current_week_start += timedelta(days=7)
-        self._update_buttons()
-        await interaction.edit_original_response(view=self)
+        self._refresh_buttons()
+        # Single UPDATE_MESSAGE callback: acks and edits in one REST call
+        await interaction.response.edit_message(view=self)
 
     async def go_back(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        view = InitialSelectView(self.callback_func, self.driver_uuid, self.driver_name)
-        await interaction.edit_original_response(view=view)
+        view = _get_initial_view(self.callback_func, self.driver_uuid, self.driver_name)
+        await interaction.response.edit_message(view=view)
 
 
 class WeekSelectView(CalendarNavigationView):
@@ -169,101 +329,77 @@ class WeekSelectView(CalendarNavigationView):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.current_month = datetime.now().replace(day=1)
-        self._update_buttons()
-
-    def _get_weeks_in_month(self, month: datetime) -> List[Tuple[datetime, datetime]]:
-        """Get all weeks (Mon-Sun) that overlap with the month"""
-        weeks = []
+        self.current_month = utcnow().date().replace(day=1)
+        self._build_buttons()
 
-        # Start from first day of month
-        first_day = month.replace(day=1)
-        # Find the Monday of that week
-        days_to_monday = first_day.weekday()
-        week_start = first_day - timedelta(days=days_to_monday)
-
-        # Get last day of month
-        last_day = month.replace(day=calendar.monthrange(month.year, month.month)[1])
+    def _build_buttons(self):
+        """Create the fixed button layout once; navigation mutates in place"""
+        # Navigation row
+        self._prev_button = ui.Button(label="◀", style=_BTN_SEC, row=0)
+        self._prev_button.callback = self.prev_month
+        self.add_item(self._prev_button)
+
+        self._label_button = ui.Button(style=_BTN_SEC, row=0, disabled=True)
+        self.add_item(self._label_button)
+
+        self._next_button = ui.Button(label="▶", style=_BTN_SEC, row=0)
+        self._next_button.callback = self.next_month
+        self.add_item(self._next_button)
+
+        # Week buttons (max 4 shown)
+        self._week_buttons = []
+        for i in range(4):
+            button = ui.Button(row=i // 2 + 1)
+            button.callback = self._on_week_click
+            self._week_buttons.append(button)
+            self.add_item(button)
 
-        # Collect all weeks that overlap with this month
-        while week_start <= last_day:
-            week_end = week_start + timedelta(days=6)
-            weeks.append((week_start, week_end))
-            week_start += timedelta(days=7)
+        # Back button
+        back_button = ui.Button(label="🔙 Back", style=_BTN_ERR, row=3)
+        back_button.callback = self.go_back
+        self.add_item(back_button)
 
-        return weeks
+        self._refresh_buttons()
 
-    def _update_buttons(self):
+    def _refresh_buttons(self):
         """Update buttons for week selection"""
-        self.clear_items()
+        self._refresh_window()
 
-        # Navigation row
-        prev_month = (self.current_month - timedelta(days=1)).replace(day=1)
-        next_month = (self.current_month + timedelta(days=32)).replace(day=1)
-
-        # Previous month button
-        prev_button = ui.Button(label="◀", style=discord.ButtonStyle.secondary, row=0)
-        prev_button.disabled = not self.check_date_limits(prev_month)
-        prev_button.callback = self.prev_month
-        self.add_item(prev_button)
-
-        # Month label
-        month_label = self.current_month.strftime('%B %Y')
-        label_button = ui.Button(label=month_label, style=discord.ButtonStyle.secondary, row=0, disabled=True)
-        self.add_item(label_button)
-
-        # Next month button
-        next_button = ui.Button(label="▶", style=discord.ButtonStyle.secondary, row=0)
-        next_button.disabled = not self.check_date_limits(next_month)
-        next_button.callback = self.next_month
-        self.add_item(next_button)
-
-        # Week buttons
-        weeks = self._get_weeks_in_month(self.current_month)
-        for i, (week_start, week_end) in enumerate(weeks[:4]):  # Max 4 weeks shown
-            week_label = f"{week_start.strftime('%b %d')} - {week_end.strftime('%b %d')}"
+        self._prev_button.disabled = not self.check_date_limits(_prev_month(self.current_month))
+        self._next_button.disabled = not self.check_date_limits(_next_month(self.current_month))
+        self._label_button.label = f"{MONTH_NAMES[self.current_month.month - 1]} {self.current_month.year}"
 
+        today_ord = utcnow().toordinal()
+        weeks = _weeks_in_month(self.current_month.year, self.current_month.month)
+        for button, (week_start, week_end) in zip(self._week_buttons, weeks):
+            button.label = f"{_short_date(week_start)} - {_short_date(week_end)}"
             # Check if current week
-            now = datetime.now()
-            if week_start <= now <= week_end:
-                style = discord.ButtonStyle.success
-            else:
-                style = discord.ButtonStyle.primary
-
-            button = ui.Button(label=week_label, style=style, row=i // 2 + 1)
+            button.style = _BTN_OK if week_start.toordinal() <= today_ord <= week_end.toordinal() else _BTN_PRI
             button.disabled = not self.check_date_limits(week_start)
-            button.callback = self._make_week_callback(week_start, week_end)
-            self.add_item(button)
-
-        # Back button
-        back_button = ui.Button(label="🔙 Back", style=discord.ButtonStyle.danger, row=3)
-        back_button.callback = self.go_back
-        self.add_item(back_button)
-
-    def _make_week_callback(self, week_start: datetime, week_end: datetime):
-        async def callback(interaction: discord.Interaction):
-            await interaction.response.defer()
-            await self.callback_func(interaction, (week_start, week_end), self.driver_uuid, view_type='week')
-            self.stop()
+            button.custom_id = f"week:{week_start.toordinal()}"
 
-        return callback
+    async def _on_week_click(self, interaction: discord.Interaction):
+        week_start = datetime.fromordinal(int(interaction.data['custom_id'].split(':')[1]))
+        week_end = week_start + timedelta(days=6)
+        await interaction.response.defer(thinking=True)
+        await self.callback_func(interaction, (week_start, week_end), self.driver_uuid, view_type='week')
+        self.stop()
 
     async def prev_month(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        self.current_month = (self.current_month - timedelta(days=1)).replace(day=1)
-        self._update_buttons()
-        await interaction.edit_original_response(view=self)
+        self.current_month = _prev_month(self.current_month)
+        self._refresh_buttons()
+        # Single UPDATE_MESSAGE callback: acks and edits in one REST call
+        await interaction.response.edit_message(view=self)
 
     async def next_month(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        self.current_month = (self.current_month + timedelta(days=32)).replace(day=1)
-        self._update_buttons()
-        await interaction.edit_original_response(view=self)
+        self.current_month = _next_month(self.current_month)
+        self._refresh_buttons()
+        # Single UPDATE_MESSAGE callback: acks and edits in one REST call
+        await interaction.response.edit_message(view=self)
 
     async def go_back(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        view = InitialSelectView(self.callback_func, self.driver_uuid, self.driver_name)
-        await interaction.edit_original_response(view=view)
+        view = _get_initial_view(self.callback_func, self.driver_uuid, self.driver_name)
+        await interaction.response.edit_message(view=view)
 
 
 class MonthSelectView(CalendarNavigationView):
@@ -271,115 +407,124 @@ class MonthSelectView(CalendarNavigationView):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.current_year = datetime.now().year
-        self._update_buttons()
-
-    def _update_buttons(self):
-        """Update buttons for month selection"""
-        self.clear_items()
+        self.current_year = utcnow().year
+        self._build_buttons()
 
+    def _build_buttons(self):
+        """Create the fixed button layout once; navigation mutates in place"""
         # Year navigation
-        prev_button = ui.Button(label="◀", style=discord.ButtonStyle.secondary, row=0)
-        prev_button.disabled = self.current_year <= COMPANY_START_DATE.year
-        prev_button.callback = self.prev_year
-        self.add_item(prev_button)
+        self._prev_button = ui.Button(label="◀", style=_BTN_SEC, row=0)
+        self._prev_button.callback = self.prev_year
+        self.add_item(self._prev_button)
 
-        year_label = ui.Button(label=str(self.current_year), style=discord.ButtonStyle.secondary, row=0, disabled=True)
-        self.add_item(year_label)
+        self._label_button = ui.Button(style=_BTN_SEC, row=0, disabled=True)
+        self.add_item(self._label_button)
 
-        next_button = ui.Button(label="▶", style=discord.ButtonStyle.secondary, row=0)
-        next_button.disabled = self.current_year >= datetime.now().year
-        next_button.callback = self.next_year
-        self.add_item(next_button)
+        self._next_button = ui.Button(label="▶", style=_BTN_SEC, row=0)
+        self._next_button.callback = self.next_year
+        self.add_item(self._next_button)
 
-        # Month buttons (3x4 grid)
+        # Month buttons (3x4 grid); labels never change, only style/state
+        self._month_buttons = []
         for i in range(12):
-            month_date = datetime(self.current_year, i + 1, 1)
-            month_name = month_date.strftime('%B')
-
-            # Determine style
-            if month_date.year == datetime.now().year and month_date.month == datetime.now().month:
-                style = discord.ButtonStyle.success
-            else:
-                style = discord.ButtonStyle.primary
-
-            row = (i // 4) + 1  # 3 rows of 4 months
-            button = ui.Button(label=month_name[:3], style=style, row=row)
-            button.disabled = not self.check_date_limits(month_date)
-            button.callback = self._make_month_callback(month_date)
+            button = ui.Button(label=MONTH_ABBR[i], row=(i // 4) + 1)
+            button.callback = self._on_month_click
+            self._month_buttons.append(button)
             self.add_item(button)
 
         # Back button
-        back_button = ui.Button(label="🔙 Back", style=discord.ButtonStyle.danger, row=4)
+        back_button = ui.Button(label="🔙 Back", style=_BTN_ERR, row=4)
         back_button.callback = self.go_back
         self.add_item(back_button)
 
-    def _make_month_callback(self, month_date: datetime):
-        async def callback(interaction: discord.Interaction):
-            await interaction.response.defer()
-            await self.callback_func(interaction, month_date, self.driver_uuid, view_type='month')
-            self.stop()
+        self._refresh_buttons()
+
+    def _refresh_buttons(self):
+        """Update buttons for month selection"""
+        self._refresh_window()
 
-        return callback
+        now = utcnow()
+        self._prev_button.disabled = self.current_year <= COMPANY_START_DATE.year
+        self._next_button.disabled = self.current_year >= now.year
+        self._label_button.label = str(self.current_year)
+
+        for i, button in enumerate(self._month_buttons):
+            month_date = date(self.current_year, i + 1, 1)
+            if month_date.year == now.year and month_date.month == now.month:
+                button.style = _BTN_OK
+            else:
+                button.style = _BTN_PRI
+            button.disabled = not self.check_date_limits(month_date)
+            button.custom_id = f"month:{month_date.toordinal()}"
+
+    async def _on_month_click(self, interaction: discord.Interaction):
+        month_date = datetime.fromordinal(int(interaction.data['custom_id'].split(':')[1]))
+        await interaction.response.defer(thinking=True)
+        await self.callback_func(interaction, month_date, self.driver_uuid, view_type='month')
+        self.stop()
 
     async def prev_year(self, interaction: discord.Interaction):
-        await interaction.response.defer()
         self.current_year -= 1
-        self._update_buttons()
-        await interaction.edit_original_response(view=self)
+        self._refresh_buttons()
+        # Single UPDATE_MESSAGE callback: acks and edits in one REST call
+        await interaction.response.edit_message(view=self)
 
     async def next_year(self, interaction: discord.Interaction):
-        await interaction.response.defer()
         self.current_year += 1
-        self._update_buttons()
-        await interaction.edit_original_response(view=self)
+        self._refresh_buttons()
+        # Single UPDATE_MESSAGE callback: acks and edits in one REST call
+        await interaction.response.edit_message(view=self)
 
     async def go_back(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        view = InitialSelectView(self.callback_func, self.driver_uuid, self.driver_name)
-        await interaction.edit_original_response(view=view)
+        view = _get_initial_view(self.callback_func, self.driver_uuid, self.driver_name)
+        await interaction.response.edit_message(view=view)
 
 
 class YearSelectView(CalendarNavigationView):
     """View for selecting years"""
 
+    # The selectable year range changes once per calendar year, so it is
+    # computed lazily and shared across every instance
+    _cached_year = None
+    _cached_years = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._update_buttons()
 
     def _update_buttons(self):
         """Update buttons for year selection"""
+        self._refresh_window()
         self.clear_items()
 
-        # Calculate available years
-        start_year = COMPANY_START_DATE.year
-        current_year = datetime.now().year
+        current_year = utcnow().year
+        if current_year != YearSelectView._cached_year:
+            YearSelectView._cached_years = tuple(range(COMPANY_START_DATE.year, current_year + 1))
+            YearSelectView._cached_year = current_year
 
         # Year buttons
-        for year in range(start_year, current_year + 1):
-            style = discord.ButtonStyle.success if year == current_year else discord.ButtonStyle.primary
-            button = ui.Button(label=str(year), style=style, row=0)
-            button.callback = self._make_year_callback(year)
+        for year in YearSelectView._cached_years:
+            style = _BTN_OK if year == current_year else _BTN_PRI
+            button = ui.Button(label=str(year), style=style, row=0,
+                               custom_id=f"year:{year}")
+            button.callback = self._on_year_click
             self.add_item(button)
 
         # Back button
-        back_button = ui.Button(label="🔙 Back", style=discord.ButtonStyle.danger, row=1)
+        back_button = ui.Button(label="🔙 Back", style=_BTN_ERR, row=1)
         back_button.callback = self.go_back
         self.add_item(back_button)
 
-    def _make_year_callback(self, year: int):
-        async def callback(interaction: discord.Interaction):
-            await interaction.response.defer()
-            year_date = datetime(year, 1, 1)
-            await self.callback_func(interaction, year_date, self.driver_uuid, view_type='year')
-            self.stop()
-
-        return callback
+    async def _on_year_click(self, interaction: discord.Interaction):
+        year = int(interaction.data['custom_id'].split(':')[1])
+        await interaction.response.defer(thinking=True)
+        year_date = datetime(year, 1, 1)
+        await self.callback_func(interaction, year_date, self.driver_uuid, view_type='year')
+        self.stop()
 
     async def go_back(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        view = InitialSelectView(self.callback_func, self.driver_uuid, self.driver_name)
-        await interaction.edit_original_response(view=view)
+        view = _get_initial_view(self.callback_func, self.driver_uuid, self.driver_name)
+        await interaction.response.edit_message(view=view)
 
 
 class CustomDateSelectView(CalendarNavigationView):
@@ -390,182 +535,368 @@ class CustomDateSelectView(CalendarNavigationView):
         self.start_date = None
         self.end_date = None
         self.selecting_end = False
-        self.current_week_start = self._get_week_start(datetime.now())
-        self._update_buttons()
+        self.current_week_start = self._get_week_start(utcnow())
+        self._build_buttons()
 
-    def _get_week_start(self, dt: datetime) -> datetime:
+    def _get_week_start(self, dt) -> date:
         """Get Monday of the week for given date"""
-        days_since_monday = dt.weekday()
-        return dt - timedelta(days=days_since_monday)
+        return _week_start(dt.year, dt.month, dt.day)
 
-    def _update_buttons(self):
+    def _build_buttons(self):
+        """Create the fixed button layout once; navigation mutates in place"""
+        # Status label
+        self._status_button = ui.Button(style=_BTN_SEC, row=0, disabled=True)
+        self.add_item(self._status_button)
+
+        # Navigation row
+        self._prev_button = ui.Button(label="◀", style=_BTN_SEC, row=1)
+        self._prev_button.callback = self.prev_week
+        self.add_item(self._prev_button)
+
+        self._label_button = ui.Button(style=_BTN_SEC, row=1, disabled=True)
+        self.add_item(self._label_button)
+
+        self._next_button = ui.Button(label="▶", style=_BTN_SEC, row=1)
+        self._next_button.callback = self.next_week
+        self.add_item(self._next_button)
+
+        # Day buttons
+        self._day_buttons = []
+        for i in range(7):
+            button = ui.Button(row=2 if i < 4 else 3)
+            button.callback = self._on_day_click
+            self._day_buttons.append(button)
+            self.add_item(button)
+
+        # Back/Cancel button
+        back_button = ui.Button(label="🔙 Back", style=_BTN_ERR, row=4)
+        back_button.callback = self.go_back
+        self.add_item(back_button)
+
+        # Reset button; only attached while a start date is selected
+        self._reset_button = ui.Button(label="🔄 Reset", style=_BTN_SEC, row=4)
+        self._reset_button.callback = self.reset_dates
+
+        self._refresh_buttons()
+
+    def _refresh_buttons(self):
         """Update buttons for custom date selection"""
-        self.clear_items()
+        self._refresh_window()
+
+        # One clock read per redraw; per-day checks are integer compares
+        today_ord = utcnow().toordinal()
+        start_ord = self.start_date.toordinal() if self.start_date else None
 
         # Status label
         if not self.selecting_end:
-            status_text = "📅 Select START Date"
+            self._status_button.label = "📅 Select START Date"
         else:
-            status_text = f"📅 Select END Date (Start: {self.start_date.strftime('%b %d, %Y')})"
-
-        status_button = ui.Button(label=status_text, style=discord.ButtonStyle.secondary, row=0, disabled=True)
-        self.add_item(status_button)
+            self._status_button.label = f"📅 Select END Date (Start: {self.start_date.strftime('%b %d, %Y')})"
 
-        # Navigation row
         prev_week = self.current_week_start - timedelta(days=7)
         next_week = self.current_week_start + timedelta(days=7)
+        self._prev_button.disabled = not self.check_date_limits(prev_week)
+        self._next_button.disabled = not self.check_date_limits(next_week)
 
-        # Previous week button
-        prev_button = ui.Button(label="◀", style=discord.ButtonStyle.secondary, row=1)
-        prev_button.disabled = not self.check_date_limits(prev_week)
-        prev_button.callback = self.prev_week
-        self.add_item(prev_button)
-
-        # Week range label
         week_end = self.current_week_start + timedelta(days=6)
-        week_label = f"{self.current_week_start.strftime('%b %d')} - {week_end.strftime('%b %d')}"
-        label_button = ui.Button(label=week_label, style=discord.ButtonStyle.secondary, row=1, disabled=True)
-        self.add_item(label_button)
-
-        # Next week button
-        next_button = ui.Button(label="▶", style=discord.ButtonStyle.secondary, row=1)
-        next_button.disabled = not self.check_date_limits(next_week)
-        next_button.callback = self.next_week
-        self.add_item(next_button)
+        self._label_button.label = f"{_short_date(self.current_week_start)} - {_short_date(week_end)}"
 
-        # Day buttons
-        for i in range(7):
+        for i, button in enumerate(self._day_buttons):
             day_date = self.current_week_start + timedelta(days=i)
-            day_name = day_date.strftime('%a')
-            day_num = day_date.strftime('%d')
+
+            day_ord = day_date.toordinal()
 
             # Determine button style
-            if self.start_date and day_date.date() == self.start_date.date():
-                style = discord.ButtonStyle.success  # Selected start date
-            elif day_date.date() == datetime.now().date():
-                style = discord.ButtonStyle.primary
+            if day_ord == start_ord:
+                style = _BTN_OK  # Selected start date
+            elif day_ord == today_ord:
+                style = _BTN_PRI
             else:
-                style = discord.ButtonStyle.secondary
+                style = _BTN_SEC
 
             # Disable dates before start date when selecting end
             disabled = not self.check_date_limits(day_date)
-            if self.selecting_end and self.start_date and day_date < self.start_date:
+            if self.selecting_end and start_ord is not None and day_ord < start_ord:
                 disabled = True
 
-            row = 2 if i < 4 else 3
-
-            button = ui.Button(
-                label=f"{day_name}\n{day_num}",
-                style=style,
-                row=row,
-                disabled=disabled
-            )
-            button.callback = self._make_day_callback(day_date)
-            self.add_item(button)
-
-        # Back/Cancel button
-        back_button = ui.Button(label="🔙 Back", style=discord.ButtonStyle.danger, row=4)
-        back_button.callback = self.go_back
-        self.add_item(back_button)
+            button.label = f"{DAY_ABBR[day_date.weekday()]}\n{day_date.day:02d}"
+            button.style = style
+            button.disabled = disabled
+            button.custom_id = f"cday:{day_date.toordinal()}"
 
-        # Reset button if we have a start date
-        if self.start_date:
-            reset_button = ui.Button(label="🔄 Reset", style=discord.ButtonStyle.secondary, row=4)
-            reset_button.callback = self.reset_dates
-            self.add_item(reset_button)
+        # Reset button only while we have a start date
+        if self.start_date and self._reset_button not in self.children:
+            self.add_item(self._reset_button)
+        elif not self.start_date and self._reset_button in self.children:
+            self.remove_item(self._reset_button)
 
-    def _make_day_callback(self, day_date: datetime):
-        async def callback(interaction: discord.Interaction):
-            await interaction.response.defer()
-
-            if not self.selecting_end:
-                # Selecting start date
-                self.start_date = day_date
-                self.selecting_end = True
-                self._update_buttons()
-                await interaction.edit_original_response(view=self)
-            else:
-                # Selecting end date
-                self.end_date = day_date
-                await self.callback_func(interaction, (self.start_date, self.end_date), self.driver_uuid,
-                                         view_type='custom')
-                self.stop()
-
-        return callback
+    async def _on_day_click(self, interaction: discord.Interaction):
+        day_date = datetime.fromordinal(int(interaction.data['custom_id'].split(':')[1]))
+        if not self.selecting_end:
+            # Selecting start date - single UPDATE_MESSAGE callback
+            self.start_date = day_date
+            self.selecting_end = True
+            self._refresh_buttons()
+            await interaction.response.edit_message(view=self)
+        else:
+            # Selecting end date - heavy work follows, defer thinking
+            await interaction.response.defer(thinking=True)
+            self.end_date = day_date
+            await self.callback_func(interaction, (self.start_date, self.end_date), self.driver_uuid,
+                                     view_type='custom')
+            self.stop()
 
     async def prev_week(self, interaction: discord.Interaction):
-        await interaction.response.defer()
         self.current_week_start -= timedelta(days=7)
-        self._update_buttons()
-        await interaction.edit_original_response(view=self)
+        self._refresh_buttons()
+        # Single UPDATE_MESSAGE callback: acks and edits in one REST call
+        await interaction.response.edit_message(view=self)
 
     async def next_week(self, interaction: discord.Interaction):
-        await interaction.response.defer()
         self.current_week_start += timedelta(days=7)
-        self._update_buttons()
-        await interaction.edit_original_response(view=self)
+        self._refresh_buttons()
+        # Single UPDATE_MESSAGE callback: acks and edits in one REST call
+        await interaction.response.edit_message(view=self)
 
     async def reset_dates(self, interaction: discord.Interaction):
-        await interaction.response.defer()
         self.start_date = None
         self.end_date = None
         self.selecting_end = False
-        self._update_buttons()
-        await interaction.edit_original_response(view=self)
+        self._refresh_buttons()
+        # Single UPDATE_MESSAGE callback: acks and edits in one REST call
+        await interaction.response.edit_message(view=self)
 
     async def go_back(self, interaction: discord.Interaction):
+        view = _get_initial_view(self.callback_func, self.driver_uuid, self.driver_name)
+        await interaction.response.edit_message(view=view)
+
+
+class DriverListView(ui.View):
+    """Paginated driver list so large fleets aren't loaded in one go"""
+
+    PAGE_SIZE = 25
+
+    def __init__(self, page_text, total: int, timeout: int = 180):
+        super().__init__(timeout=timeout)
+        # Callable returning the preformatted driver lines for a page;
+        # the cog caches these so paging back and forth skips the query
+        self.page_text = page_text
+        self.total = total
+        self.page = 0
+        self._update_buttons()
+
+    @property
+    def max_page(self) -> int:
+        return (self.total - 1) // self.PAGE_SIZE
+
+    def _update_buttons(self):
+        self.prev_page.disabled = self.page <= 0
+        self.next_page.disabled = self.page >= self.max_page
+
+    def build_embed(self) -> discord.Embed:
+        embed = discord.Embed(
+            title="👥 Driver List",
+            description="Use driver number with !driver-stats command",
+            color=0x0099ff,
+            timestamp=utcnow()
+        )
+
+        embed.add_field(
+            name="Drivers",
+            value=self.page_text(self.page) or "No drivers",
+            inline=False
+        )
+
+        footer = "Use: !driver-stats [number]"
+        if self.max_page > 0:
+            footer += f" • Page {self.page + 1}/{self.max_page + 1}"
+        embed.set_footer(text=footer)
+        return embed
+
+    @ui.button(label="⬅️", style=_BTN_SEC)
+    async def prev_page(self, interaction: discord.Interaction, button: ui.Button):
         await interaction.response.defer()
-        view = InitialSelectView(self.callback_func, self.driver_uuid, self.driver_name)
-        await interaction.edit_original_response(view=view)
+        self.page -= 1
+        self._update_buttons()
+        await interaction.edit_original_response(embed=self.build_embed(), view=self)
+
+    @ui.button(label="➡️", style=_BTN_SEC)
+    async def next_page(self, interaction: discord.Interaction, button: ui.Button):
+        await interaction.response.defer()
+        self.page += 1
+        self._update_buttons()
+        await interaction.edit_original_response(embed=self.build_embed(), view=self)
 
 
 class FleetCommands(commands.Cog):
     """Enhanced fleet management commands with calendar interface"""
 
+    # How long a built driver-stats embed stays valid before we recompute
+    EMBED_CACHE_TTL = 60.0
+    EMBED_CACHE_MAX = 128
+
+    # Company earnings change at most every sync (10 min), so 60s is safe
+    EARNINGS_CACHE_TTL = 60.0
+    EARNINGS_CACHE_MAX = 128
+
+    # Driver roster changes rarely; short TTL covers chained commands
+    DRIVERS_CACHE_TTL = 60.0
+
+    # Fleet-wide aggregates for !fleet-stats; data changes per sync
+    FLEET_STATS_TTL = 30.0
+
+    # Closed-period driver stats only change when a sync lands; open
+    # periods stay warm just long enough to cover a prefetched click
+    STATS_CACHE_TTL = 300.0
+    OPEN_STATS_CACHE_TTL = 30.0
+    STATS_CACHE_MAX = 128
+
+    # Window during which repeated !sync calls collapse into one run
+    SYNC_DEBOUNCE_SECONDS = 2.0
+
     def __init__(self, bot):
         self.bot = bot
         self.bolt_client = bot.bolt_client
+        # (driver_uuid, view_type, start, end) -> (expires_at, embed)
+        # Collapses repeated clicks on the same period into a dict lookup
+        self._embed_cache = OrderedDict()
+        # (start, end) -> (fetched_at, CompanyStats), LRU-evicted
+        self._earnings_cache = OrderedDict()
+        # Roster lookups (driver number -> driver, total count) by key
+        self._drivers_cache = {}
+        # (driver_uuid, start, end) -> (expires_at, stats), LRU-evicted
+        self._stats_cache = OrderedDict()
+        # (expires_at, (week_stats, all_time_stats, db_stats)) for
+        # !fleet-stats; spam-proofing for three sqlite aggregations
+        self._fleet_stats_cache = None
+        # Background warm-up tasks started by driver_stats
+        self._prefetch_tasks = set()
+        self._pending_sync_timer: Optional[asyncio.TimerHandle] = None
+        self._pending_sync_msg: Optional[discord.Message] = None
+        self._sync_lock = asyncio.Lock()
+        self._help_base = self._build_help_base()
+
+    @staticmethod
+    def _build_help_base() -> discord.Embed:
+        """Static portion of the help embed, built once per cog load.
+
+        The admin field and timestamp vary per invocation and are added
+        onto a copy() in help_command.
+        """
+        embed = discord.Embed(
+            title="📚 DesiSquad Fleet Bot Commands",
+            description="Here are all the available commands:",
+            color=0x0099ff
+        )
+
+        # General Commands
+        embed.add_field(
+            name="📋 General Commands",
+            value=(
+                "**!help** - Show this help message\n"
+                "**!sync** - Sync database with Bolt API (debounced; the last call in a burst wins)\n"
+                "**!fleet-stats** - Display fleet overview statistics"
+            ),
+            inline=False
+        )
+
+        # Driver Commands
+        embed.add_field(
+            name="👥 Driver Commands",
+            value=(
+                "**!drivers** - List all drivers with their numbers\n"
+                "**!driver-stats [number]** - Get detailed driver statistics with calendar selection"
+            ),
+            inline=False
+        )
+
+        # Company Commands
+        embed.add_field(
+            name="🏢 Company Commands",
+            value=(
+                "**!company-earnings** - View company earnings with calendar selection"
+            ),
+            inline=False
+        )
+
+        embed.set_footer(text="Use !command or /command for slash commands • Data updates every 10 minutes")
+        return embed
+
+    def _roster_cached(self, key, fetch):
+        """TTL-cache roster lookups; the roster only changes on sync"""
+        entry = self._drivers_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.DRIVERS_CACHE_TTL:
+            return entry[1]
+        value = fetch()
+        self._drivers_cache[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate_drivers_cache(self):
+        """Drop cached roster lookups; called after a sync lands new data"""
+        self._drivers_cache.clear()
+
+    def _drivers_page_text(self, page: int) -> str:
+        """Preformatted driver lines for one list page, TTL-cached.
+
+        The text only changes when a sync lands a roster change, so repeat
+        !drivers calls and page flips reuse the joined string instead of
+        re-querying and re-formatting.
+        """
+        def fetch():
+            drivers = self.bolt_client.db.get_drivers_page(
+                limit=DriverListView.PAGE_SIZE, offset=page * DriverListView.PAGE_SIZE)
+            return "\n".join(f"**{num}.** {name}" for num, uuid, name in drivers)
+
+        return self._roster_cached(('drivers_page', page), fetch)
+
+    def invalidate_stats_cache(self, since: Optional[int] = None):
+        """Drop cached stats/embeds whose period touches data changed at or
+        after the given unix timestamp.
+
+        A routine sync only lands recent orders, so closed historical
+        periods stay cached and keep their hit rate. Passing None clears
+        everything (full sync / unknown extent).
+        """
+        # Fleet-wide totals include open periods, so any new data stales them
+        self._fleet_stats_cache = None
+
+        if since is None:
+            self._embed_cache.clear()
+            self._earnings_cache.clear()
+            self._stats_cache.clear()
+            return
+
+        cutoff = datetime.fromtimestamp(since, tz=UTC)
+        naive_cutoff = cutoff.replace(tzinfo=None)
+        for key in [k for k in self._embed_cache if k[3] >= cutoff]:
+            del self._embed_cache[key]
+        # Earnings keys come straight from the calendar views and are naive
+        for key in [k for k in self._earnings_cache
+                    if k[1] >= (cutoff if k[1].tzinfo else naive_cutoff)]:
+            del self._earnings_cache[key]
+        cutoff_iso = cutoff.isoformat()
+        for key in [k for k in self._stats_cache if k[2] >= cutoff_iso]:
+            del self._stats_cache[key]
+
+    @staticmethod
+    async def _send_followup(interaction: discord.Interaction, **kwargs):
+        """Send a followup, falling back to the channel if the token expired.
+
+        Heavy HTTP/DB work inside a button callback can outlive the
+        interaction token, after which followup.send raises NotFound.
+        """
+        try:
+            await interaction.followup.send(**kwargs)
+        except discord.NotFound:
+            logger.warning("Interaction expired, falling back to channel send")
+            await interaction.channel.send(**kwargs)
 
     @commands.hybrid_command(name="help", description="Show all available commands")
     async def help_command(self, ctx):
         """Display all available commands with descriptions"""
         try:
-            embed = discord.Embed(
-                title="📚 DesiSquad Fleet Bot Commands",
-                description="Here are all the available commands:",
-                color=0x0099ff,
-                timestamp=datetime.now()
-            )
-
-            # General Commands
-            embed.add_field(
-                name="📋 General Commands",
-                value=(
-                    "**!help** - Show this help message\n"
-                    "**!sync** - Sync database with Bolt API (cooldown: 60s)\n"
-                    "**!fleet-stats** - Display fleet overview statistics"
-                ),
-                inline=False
-            )
-
-            # Driver Commands
-            embed.add_field(
-                name="👥 Driver Commands",
-                value=(
-                    "**!drivers** - List all drivers with their numbers\n"
-                    "**!driver-stats [number]** - Get detailed driver statistics with calendar selection"
-                ),
-                inline=False
-            )
-
-            # Company Commands
-            embed.add_field(
-                name="🏢 Company Commands",
-                value=(
-                    "**!company-earnings** - View company earnings with calendar selection"
-                ),
-                inline=False
-            )
+            embed = self._help_base.copy()
+            embed.timestamp = utcnow()
 
             # Admin Commands (if the user has admin permissions)
             if ctx.author.guild_permissions.administrator:
@@ -579,9 +910,6 @@ class FleetCommands(commands.Cog):
                     inline=False
                 )
 
-            # Footer with additional info
-            embed.set_footer(text="Use !command or /command for slash commands • Data updates every 10 minutes")
-
             if hasattr(ctx, 'followup'):
                 await ctx.followup.send(embed=embed)
             else:
@@ -593,6 +921,7 @@ class FleetCommands(commands.Cog):
 
     @commands.hybrid_command(name="company-earnings", description="Get company earnings with calendar selection")
     @commands.has_role("Admin")
+    @timed
     @in_channel([1415574639731802223])
     async def company_earnings(self, ctx):
         """Display company earnings with interactive calendar selection"""
@@ -621,6 +950,7 @@ class FleetCommands(commands.Cog):
             logger.error(f"Company earnings command failed: {e}")
             await ctx.send(f"❌ Failed to fetch earnings: {str(e)}")
 
+    @timed
     async def _show_company_earnings(self, interaction: discord.Interaction, date_input, driver_uuid=None,
                                      view_type: str = None):
         """Show company earnings for selected period"""
@@ -652,77 +982,91 @@ class FleetCommands(commands.Cog):
             else:
                 raise ValueError(f"Unknown view type: {view_type}")
 
-            # Get company earnings from database
-            stats = self.bolt_client.db.get_company_earnings_by_date_range(start_date, end_date)
-
-            if not stats or stats['trips_completed'] == 0:
-                await interaction.followup.send("No data found for this period.")
+            # Get company earnings from database, reusing recent results
+            # for repeat clicks on the same period
+            cache_key = (start_date, end_date)
+            entry = self._earnings_cache.get(cache_key)
+            if entry and time.monotonic() - entry[0] < self.EARNINGS_CACHE_TTL:
+                stats = entry[1]
+                self._earnings_cache.move_to_end(cache_key)
+            else:
+                with track('db'):
+                    stats = await self.bolt_client.get_company_earnings(start_date, end_date)
+                self._earnings_cache[cache_key] = (time.monotonic(), stats)
+                self._earnings_cache.move_to_end(cache_key)
+                while len(self._earnings_cache) > self.EARNINGS_CACHE_MAX:
+                    self._earnings_cache.popitem(last=False)
+
+            if not stats or stats.trips_completed == 0:
+                await self._send_followup(interaction, content="No data found for this period.")
                 return
 
             # Create earnings embed
             embed = discord.Embed(
                 title=f"💰 DesiSquad Earnings - {period_text}",
                 color=0x00d4aa,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             )
 
             # Earnings section
             embed.add_field(
                 name="💵 Earnings",
-                value=(
-                    f"**Gross Earnings:** {stats['gross_earnings']} RON\n"
-                    f"**Total Fees:** {stats['total_fees']} RON\n"
-                    f"**Net Earnings:** {stats['net_earnings']} RON\n"
-                    f"**💸 Cash Collected:** {stats['cash_collected']} RON"
-                ),
+                value="\n".join((
+                    f"**Gross Earnings:** {stats.gross_earnings} RON",
+                    f"**Total Fees:** {stats.total_fees} RON",
+                    f"**Net Earnings:** {stats.net_earnings} RON",
+                    f"**💸 Cash Collected:** {stats.cash_collected} RON",
+                )),
                 inline=False
             )
 
             # Trips section
             embed.add_field(
                 name="📊 Trips",
-                value=(
-                    f"**Trips Completed:** {stats['trips_completed']}\n"
-                    f"**Total Distance:** {stats['total_distance']} km\n"
-                    f"**Average Distance:** {stats['avg_distance']} km/trip"
-                ),
+                value="\n".join((
+                    f"**Trips Completed:** {stats.trips_completed}",
+                    f"**Total Distance:** {stats.total_distance} km",
+                    f"**Average Distance:** {stats.avg_distance} km/trip",
+                )),
                 inline=False
             )
 
             # Metrics section
+            metrics_lines = [
+                f"**Earnings/Trip:** {stats.earnings_per_trip} RON",
+                f"**Earnings/KM:** {stats.earnings_per_km} RON/km",
+            ]
+            if stats.avg_rating > 0:
+                metrics_lines.append(f"**Average Rating:** {stats.avg_rating}/5 ⭐")
+
             embed.add_field(
                 name="📈 Performance Metrics",
-                value=(
-                    f"**Earnings/Trip:** {stats['earnings_per_trip']} RON\n"
-                    f"**Earnings/KM:** {stats['earnings_per_km']} RON/km\n"
-                    f"**Average Rating:** {stats['avg_rating']}/5 ⭐" if stats[
-                                                                            'avg_rating'] > 0 else f"**Earnings/Trip:** {stats['earnings_per_trip']} RON\n**Earnings/KM:** {stats['earnings_per_km']} RON/km"
-                ),
+                value="\n".join(metrics_lines),
                 inline=False
             )
 
             # Driver breakdown if available
-            if stats.get('driver_breakdown'):
-                driver_text = []
-                for driver in stats['driver_breakdown'][:5]:  # Top 5 drivers
-                    driver_text.append(f"**{driver['name']}:** {driver['trips']} trips, {driver['earnings']} RON")
-
-                if driver_text:
-                    embed.add_field(
-                        name="🏆 Top Drivers",
-                        value="\n".join(driver_text),
-                        inline=False
-                    )
+            if stats.driver_breakdown:
+                driver_text = "\n".join(
+                    f"**{driver['name']}:** {driver['trips']} trips, {driver['earnings']} RON"
+                    for driver in stats.driver_breakdown[:5]  # Top 5 drivers
+                )
+                embed.add_field(
+                    name="🏆 Top Drivers",
+                    value=driver_text,
+                    inline=False
+                )
 
             embed.set_footer(text=f"View Type: {view_type.capitalize()} • Data from local database")
 
-            await interaction.followup.send(embed=embed)
+            await self._send_followup(interaction, embed=embed)
 
         except Exception as e:
             logger.error(f"Failed to show company earnings: {e}")
-            await interaction.followup.send(f"❌ Failed to fetch earnings: {str(e)}")
+            await self._send_followup(interaction, content=f"❌ Failed to fetch earnings: {str(e)}")
 
     @commands.hybrid_command(name="driver-stats", description="Get driver statistics with interactive calendar")
+    @timed
     async def driver_stats(self, ctx, driver_number: int):
         """Display driver statistics with interactive calendar selection"""
         try:
@@ -732,14 +1076,15 @@ class FleetCommands(commands.Cog):
                 async with ctx.typing():
                     pass
 
-            # Get driver UUID from number
-            drivers = self.bolt_client.db.get_all_drivers()
-            if driver_number < 1 or driver_number > len(drivers):
+            # Look up just the one driver instead of fetching the whole list
+            driver = self._roster_cached(
+                ('driver', driver_number),
+                lambda: self.bolt_client.db.get_driver_by_number(driver_number))
+            if not driver:
                 await ctx.send("❌ Invalid driver number. Use !drivers to see the list.")
                 return
 
-            driver_uuid = drivers[driver_number - 1][1]
-            driver_name = drivers[driver_number - 1][2]
+            driver_uuid, driver_name = driver
 
             # Show initial selection view
             view = InitialSelectView(self._show_driver_stats, driver_uuid, driver_name)
@@ -755,22 +1100,143 @@ class FleetCommands(commands.Cog):
             else:
                 await ctx.send(embed=embed, view=view)
 
+            # Warm the stats cache during the user's think time so the
+            # first click usually lands on memoized data
+            task = asyncio.create_task(self._prefetch_common_stats(driver_uuid))
+            self._prefetch_tasks.add(task)
+            task.add_done_callback(self._prefetch_tasks.discard)
+
         except Exception as e:
             logger.error(f"Driver stats command failed: {e}")
             await ctx.send(f"❌ Failed to fetch driver stats: {str(e)}")
 
+    async def _prefetch_common_stats(self, driver_uuid: str):
+        """Prefetch the periods users pick most: today, yesterday, this week"""
+        today_start = datetime.now(ROMANIA_TZ).replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = today_start - timedelta(days=today_start.weekday())
+        periods = (
+            (today_start, today_start + timedelta(days=1)),
+            (today_start - timedelta(days=1), today_start),
+            (week_start, week_start + timedelta(days=7)),
+        )
+
+        for local_start, local_end in periods:
+            try:
+                await self._compute_stats(driver_uuid, local_start.astimezone(UTC), local_end.astimezone(UTC))
+            except Exception as e:
+                logger.debug(f"Stats prefetch failed for {driver_uuid}: {e}")
+
+    def cog_unload(self):
+        """Cancel background work when the cog is unloaded"""
+        for task in self._prefetch_tasks:
+            task.cancel()
+        if self._pending_sync_timer:
+            self._pending_sync_timer.cancel()
+
+    @timed
+    async def _compute_stats(self, driver_uuid: str, start_date: datetime, end_date: datetime):
+        """Fetch state logs and aggregate driver stats for a UTC period.
+
+        Results for closed periods (ending more than an hour ago) are
+        memoized with a TTL so repeated calendar clicks skip both the
+        Bolt API round-trip and the sqlite aggregation; an open period
+        is always recomputed.
+        """
+        cache_key = (driver_uuid, start_date.isoformat(), end_date.isoformat())
+        entry = self._stats_cache.get(cache_key)
+        if entry and entry[0] > time.monotonic():
+            self._stats_cache.move_to_end(cache_key)
+            return entry[1]
+
+        # All sqlite work goes through the client's stats executor (same
+        # as get_company_earnings) so aggregation — and the prefetch runs
+        # that trigger three of these per command — never stalls the loop
+        db = self.bolt_client.db
+        loop = asyncio.get_running_loop()
+        executor = self.bolt_client._stats_executor
+
+        # An empty period needs no state-log round-trip (common for new or
+        # inactive drivers); a cheap COUNT decides before the API is touched
+        with track('db'):
+            order_count = await loop.run_in_executor(
+                executor, db.get_driver_order_count, driver_uuid, start_date, end_date
+            )
+        has_orders = order_count > 0
+
+        # Fetch state logs if within 31 days, preferring the local cache
+        state_logs = []
+        days_diff = (end_date - start_date).days
+        if not has_orders:
+            logger.info("No finished orders in period, skipping state logs fetch")
+        elif days_diff <= 31:
+            with track('db'):
+                cached_logs = await loop.run_in_executor(
+                    executor, db.get_cached_state_logs, start_date, end_date
+                )
+            if cached_logs is not None:
+                state_logs = cached_logs
+                logger.info(f"Using {len(state_logs)} cached state logs")
+            else:
+                try:
+                    with track('api'):
+                        state_response = await self.bolt_client.get_fleet_state_logs(
+                            start_date=start_date,
+                            end_date=end_date,
+                            limit=1000
+                        )
+                    if state_response.get("code") == 0:
+                        state_logs = state_response.get("data", {}).get("state_logs", [])
+                        logger.info(f"Fetched {len(state_logs)} state logs")
+                        # A response at the limit may be truncated; only
+                        # complete ones are safe to serve from cache later
+                        if len(state_logs) < 1000:
+                            await loop.run_in_executor(
+                                executor, db.cache_state_logs, start_date, end_date, state_logs
+                            )
+                except Exception as e:
+                    logger.warning(f"Could not fetch state logs: {e}")
+        else:
+            logger.info(f"Period > 31 days ({days_diff}), skipping state logs fetch")
+
+        # The fetch is fleet-wide; narrow to this driver once so the DB
+        # layer doesn't re-scan the full list in each of its passes
+        if state_logs:
+            state_logs = [log for log in state_logs if log.get('driver_uuid') == driver_uuid]
+
+        # Get stats (the aggregate returns None for empty periods, so the
+        # short-circuited result is cached the same way as a real miss)
+        stats = None
+        if has_orders:
+            with track('db'):
+                stats = await loop.run_in_executor(
+                    executor, db.get_driver_stats_by_date_range,
+                    driver_uuid, start_date, end_date, state_logs
+                )
+
+        if stats:
+            # The embed footer reports whether precise state logs or the
+            # order-gap estimate produced the time figures
+            stats['had_state_logs'] = bool(state_logs)
+
+        if end_date < utcnow() - timedelta(hours=1):
+            ttl = self.STATS_CACHE_TTL
+        else:
+            ttl = self.OPEN_STATS_CACHE_TTL
+        self._stats_cache[cache_key] = (time.monotonic() + ttl, stats)
+        self._stats_cache.move_to_end(cache_key)
+        while len(self._stats_cache) > self.STATS_CACHE_MAX:
+            self._stats_cache.popitem(last=False)
+
+        return stats
+
     async def _show_driver_stats(self, interaction: discord.Interaction, date_input, driver_uuid: str, view_type: str):
         """Show driver stats with complete time tracking (Romania-local periods, UTC queries)"""
         try:
-            import pytz
-            romania_tz = pytz.timezone("Europe/Bucharest")
-            utc = pytz.UTC
-
             # Normalize input -> Romania tz
             def to_romania(d: datetime) -> datetime:
                 if d.tzinfo is None:
-                    return romania_tz.localize(d)
-                return d.astimezone(romania_tz)
+                    return d.replace(tzinfo=ROMANIA_TZ)
+                return d.astimezone(ROMANIA_TZ)
 
             # Calculate start_date and end_date (Romania), then convert to UTC
             if view_type == "day":
@@ -785,17 +1251,14 @@ class FleetCommands(commands.Cog):
                 period_text = f"{local_start.strftime('%b %d')} - {week_end.strftime('%b %d, %Y')}"
 
             elif view_type == "month":
-                local_start = to_romania(date_input).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-                if local_start.month == 12:
-                    local_end = local_start.replace(year=local_start.year + 1, month=1)
-                else:
-                    local_end = local_start.replace(month=local_start.month + 1)
-                period_text = local_start.strftime("%B %Y")
+                local = to_romania(date_input)
+                start_date, end_date = _month_bounds_utc(local.year, local.month)
+                period_text = f"{MONTH_NAMES[local.month - 1]} {local.year}"
 
             elif view_type == "year":
-                local_start = to_romania(date_input).replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-                local_end = local_start.replace(year=local_start.year + 1)
-                period_text = str(local_start.year)
+                local = to_romania(date_input)
+                start_date, end_date = _year_bounds_utc(local.year)
+                period_text = str(local.year)
 
             elif view_type == "custom":
                 custom_start, custom_end = date_input
@@ -807,113 +1270,108 @@ class FleetCommands(commands.Cog):
             else:
                 raise ValueError(f"Unknown view type: {view_type}")
 
-            # Convert to UTC for querying
-            start_date = local_start.astimezone(utc)
-            end_date = local_end.astimezone(utc)
+            # Convert to UTC for querying (month/year come pre-converted)
+            if view_type not in ("month", "year"):
+                start_date = local_start.astimezone(UTC)
+                end_date = local_end.astimezone(UTC)
 
             logger.info(f"[{view_type}] period {period_text}")
             logger.info(f"Querying from {start_date} to {end_date} (UTC)")
 
-            # Fetch state logs if within 31 days
-            state_logs = []
-            days_diff = (end_date - start_date).days
-            if days_diff <= 31:
-                async with self.bolt_client:
-                    try:
-                        state_response = await self.bolt_client.get_fleet_state_logs(
-                            start_date=start_date,
-                            end_date=end_date,
-                            limit=1000
-                        )
-                        if state_response.get("code") == 0:
-                            state_logs = state_response.get("data", {}).get("state_logs", [])
-                            logger.info(f"Fetched {len(state_logs)} state logs")
-                    except Exception as e:
-                        logger.warning(f"Could not fetch state logs: {e}")
-            else:
-                logger.info(f"Period > 31 days ({days_diff}), skipping state logs fetch")
-
-            # Get stats
-            stats = self.bolt_client.db.get_driver_stats_by_date_range(
-                driver_uuid,
-                start_date,
-                end_date,
-                state_logs
-            )
+            # Serve a recently built embed for the same period if we have one
+            cache_key = (driver_uuid, view_type, start_date, end_date)
+            cached = self._embed_cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                self._embed_cache.move_to_end(cache_key)
+                await self._send_followup(interaction, embed=cached[1])
+                return
+
+            # Fetch state logs and aggregate, memoized for repeat periods
+            stats = await self._compute_stats(driver_uuid, start_date, end_date)
 
             if not stats:
-                await interaction.followup.send(f"No data found for this period ({period_text}).")
+                await self._send_followup(interaction, content=f"No data found for this period ({period_text}).")
                 return
 
+            # Bind the hot fields to locals once instead of re-hashing the
+            # dict for every embed line
+            gross = stats['gross_earnings']
+            net = stats['net_earnings']
+            active_hours = stats['hours_worked']
+            online_hours = stats['total_online_hours']
+            waiting_hours = stats['waiting_hours']
+            had_state_logs = stats.get('had_state_logs', False)
+
             # Build embed
             embed = discord.Embed(
                 title=f"👤 {stats['driver_name']} - {period_text}",
                 color=0xff9500,
-                timestamp=datetime.now(utc)
+                timestamp=utcnow()
             )
 
             embed.add_field(
                 name="📊 Orders & Earnings",
-                value=(
-                    f"**Orders Completed:** {stats['orders_completed']}\n"
-                    f"**Gross Earnings:** {stats['gross_earnings']} RON\n"
-                    f"**Net Earnings:** {stats['net_earnings']} RON\n"
-                    f"**💵 Cash Collected:** {stats['cash_collected']} RON"
-                ),
+                value="\n".join((
+                    f"**Orders Completed:** {stats['orders_completed']}",
+                    f"**Gross Earnings:** {gross} RON",
+                    f"**Net Earnings:** {net} RON",
+                    f"**💵 Cash Collected:** {stats['cash_collected']} RON",
+                )),
                 inline=False
             )
 
             # Hours
-            active_h = int(stats['hours_worked'])
-            active_m = int((stats['hours_worked'] - active_h) * 60)
-            total_h = int(stats['total_online_hours'])
-            total_m = int((stats['total_online_hours'] - total_h) * 60)
-            waiting_h = int(stats['waiting_hours'])
-            waiting_m = int((stats['waiting_hours'] - waiting_h) * 60)
+            active_h, active_m = _hm(active_hours)
+            total_h, total_m = _hm(online_hours)
+            waiting_h, waiting_m = _hm(waiting_hours)
 
             embed.add_field(
                 name="📍 Distance & Time",
-                value=(
-                    f"**Total Distance:** {stats['total_distance']} km\n"
-                    f"**Avg Distance/Trip:** {stats['avg_distance']} km\n"
-                    f"**Total Online:** {total_h}h {total_m}m\n"
-                    f"├─ **Active:** {active_h}h {active_m}m\n"
-                    f"└─ **Waiting:** {waiting_h}h {waiting_m}m"
-                ),
+                value="\n".join((
+                    f"**Total Distance:** {stats['total_distance']} km",
+                    f"**Avg Distance/Trip:** {stats['avg_distance']} km",
+                    f"**Total Online:** {total_h}h {total_m}m",
+                    f"├─ **Active:** {active_h}h {active_m}m",
+                    f"└─ **Waiting:** {waiting_h}h {waiting_m}m",
+                )),
                 inline=False
             )
 
             # Performance metrics
-            net_per_hour_total = stats['net_earnings'] / stats['total_online_hours'] if stats[
-                                                                                            'total_online_hours'] > 0 else 0
-            net_per_hour_active = stats['net_earnings'] / stats['hours_worked'] if stats['hours_worked'] > 0 else 0
+            net_per_hour_total = net / online_hours if online_hours > 0 else 0
+            net_per_hour_active = net / active_hours if active_hours > 0 else 0
 
             embed.add_field(
                 name="💰 Performance Metrics",
-                value=(
-                    f"**Gross Earnings/Hour:** {stats['earnings_per_hour']:.2f} Total | {stats['earnings_per_hour_active']:.2f} Active\n"
-                    f"**Net Earnings/Hour:** {net_per_hour_total:.2f} Total | {net_per_hour_active:.2f} Active\n"
-                    f"**Earnings/KM:** {stats['earnings_per_km']} RON/km"
-                ),
+                value="\n".join((
+                    f"**Gross Earnings/Hour:** {stats['earnings_per_hour']:.2f} Total | {stats['earnings_per_hour_active']:.2f} Active",
+                    f"**Net Earnings/Hour:** {net_per_hour_total:.2f} Total | {net_per_hour_active:.2f} Active",
+                    f"**Earnings/KM:** {stats['earnings_per_km']} RON/km",
+                )),
                 inline=False
             )
 
             # Footer
             footer_text = f"View Type: {view_type.capitalize()} | Romania time (local)"
-            if stats['waiting_hours'] > 0 and not state_logs:
+            if waiting_hours > 0 and not had_state_logs:
                 footer_text += " | Waiting time estimated from order gaps"
-            elif state_logs:
+            elif had_state_logs:
                 footer_text += " | Time data from driver state logs"
 
             embed.set_footer(text=footer_text)
 
-            await interaction.followup.send(embed=embed)
+            self._embed_cache[cache_key] = (time.monotonic() + self.EMBED_CACHE_TTL, embed)
+            self._embed_cache.move_to_end(cache_key)
+            while len(self._embed_cache) > self.EMBED_CACHE_MAX:
+                self._embed_cache.popitem(last=False)
+            await self._send_followup(interaction, embed=embed)
 
         except Exception as e:
             logger.error(f"Failed to show driver stats: {e}")
-            await interaction.followup.send(f"❌ Failed to fetch statistics: {str(e)}")
+            await self._send_followup(interaction, content=f"❌ Failed to fetch statistics: {str(e)}")
 
     @commands.hybrid_command(name="fleet-stats", description="Get DesiSquad fleet statistics")
+    @timed
     async def fleet_stats(self, ctx):
         """Display fleet statistics"""
         try:
@@ -923,41 +1381,58 @@ class FleetCommands(commands.Cog):
                 async with ctx.typing():
                     pass
 
-            # Get stats from database
-            week_stats = self.bolt_client.db.get_fleet_stats(days=7)
-            all_time_stats = self.bolt_client.db.get_fleet_stats()
-            db_stats = self.bolt_client.db.get_database_stats()
+            # A short TTL absorbs command spam; a sync that lands new
+            # orders clears the entry via invalidate_stats_cache
+            cached = self._fleet_stats_cache
+            if cached and cached[0] > time.monotonic():
+                week_stats, all_time_stats, db_stats = cached[1]
+            else:
+                # Run the three independent queries concurrently off the
+                # loop; each opens its own sqlite connection so this is
+                # thread-safe
+                db = self.bolt_client.db
+                loop = asyncio.get_running_loop()
+                with track('db'):
+                    week_stats, all_time_stats, db_stats = await asyncio.gather(
+                        loop.run_in_executor(None, db.get_fleet_stats, 7),
+                        loop.run_in_executor(None, db.get_fleet_stats),
+                        loop.run_in_executor(None, db.get_database_stats),
+                    )
+                self._fleet_stats_cache = (
+                    time.monotonic() + self.FLEET_STATS_TTL,
+                    (week_stats, all_time_stats, db_stats),
+                )
 
             embed = discord.Embed(
                 title="🚗 DesiSquad Fleet Information",
                 color=0x00ff00,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             )
 
             embed.add_field(
                 name="📊 Last 7 Days",
-                value=(
-                    f"**Trips Completed:** {week_stats['total_trips']}\n"
-                    f"**Distance Traveled:** {week_stats['total_distance_km']} km"
-                ),
+                value="\n".join((
+                    f"**Trips Completed:** {week_stats['total_trips']}",
+                    f"**Distance Traveled:** {week_stats['total_distance_km']} km",
+                )),
                 inline=True
             )
 
             embed.add_field(
                 name="📈 All Time",
-                value=(
-                    f"**Trips Completed:** {all_time_stats['total_trips']}\n"
-                    f"**Distance Traveled:** {all_time_stats['total_distance_km']} km"
-                ),
+                value="\n".join((
+                    f"**Trips Completed:** {all_time_stats['total_trips']}",
+                    f"**Distance Traveled:** {all_time_stats['total_distance_km']} km",
+                )),
                 inline=True
             )
 
             embed.add_field(
                 name="💾 Database",
-                value=(
-                    f"**Total Orders:** {db_stats['total_orders']:,}\n"
-                    f"**Size:** {db_stats['database_size_mb']} MB"
-                ),
+                value="\n".join((
+                    f"**Total Orders:** {db_stats['total_orders']:,}",
+                    f"**Size:** {db_stats['database_size_mb']} MB",
+                )),
                 inline=True
             )
 
@@ -977,6 +1452,7 @@ class FleetCommands(commands.Cog):
                 await ctx.send(error_msg)
 
     @commands.hybrid_command(name="drivers", description="List all drivers")
+    @timed
     async def drivers_list(self, ctx):
         """Display list of all drivers"""
         try:
@@ -986,9 +1462,9 @@ class FleetCommands(commands.Cog):
                 async with ctx.typing():
                     pass
 
-            drivers = self.bolt_client.db.get_all_drivers()
+            total = self._roster_cached('count', self.bolt_client.db.count_drivers)
 
-            if not drivers:
+            if not total:
                 msg = "No drivers found. Run !sync to update data."
                 if hasattr(ctx, 'followup'):
                     await ctx.followup.send(msg)
@@ -996,48 +1472,78 @@ class FleetCommands(commands.Cog):
                     await ctx.send(msg)
                 return
 
-            embed = discord.Embed(
-                title="👥 Driver List",
-                description="Use driver number with !driver-stats command",
-                color=0x0099ff,
-                timestamp=datetime.now()
-            )
+            view = DriverListView(self._drivers_page_text, total)
+            embed = view.build_embed()
 
-            driver_list = []
-            for num, uuid, name in drivers:
-                driver_list.append(f"**{num}.** {name}")
-
-            embed.add_field(
-                name="Drivers",
-                value='\n'.join(driver_list) if driver_list else "No drivers",
-                inline=False
-            )
-
-            embed.set_footer(text="Use: !driver-stats [number]")
+            # Only attach navigation buttons when there is more than one page
+            kwargs = {'embed': embed}
+            if view.max_page > 0:
+                kwargs['view'] = view
 
             if hasattr(ctx, 'followup'):
-                await ctx.followup.send(embed=embed)
+                await ctx.followup.send(**kwargs)
             else:
-                await ctx.send(embed=embed)
+                await ctx.send(**kwargs)
 
         except Exception as e:
             logger.error(f"Drivers list command failed: {e}")
             await ctx.send(f"❌ Failed to fetch drivers: {str(e)}")
 
     @commands.command(name="sync")
-    @commands.cooldown(1, 60, commands.BucketType.guild)
     async def sync_database(self, ctx, full: bool = False):
-        """Sync orders from Bolt API to local database"""
+        """Sync orders from Bolt API to local database.
+
+        Rapid repeat invocations are debounced: each call resets a short
+        timer and only the last one actually kicks off a sync, so users
+        mashing !sync don't trigger redundant full API passes.
+        """
         try:
-            await ctx.send("🔄 Starting database sync...")
+            # Keep a handle on the status message so we can edit it in place
+            # instead of posting a second message (one less API call per sync)
+            msg = await ctx.send("🔄 Sync queued...")
+
+            if self._pending_sync_timer:
+                self._pending_sync_timer.cancel()
+                # Close out the superseded caller's status message so it
+                # doesn't read as queued forever
+                if self._pending_sync_msg:
+                    try:
+                        await self._pending_sync_msg.edit(content="⏭️ Superseded by a newer !sync")
+                    except Exception:
+                        pass
+
+            self._pending_sync_msg = msg
+            loop = asyncio.get_running_loop()
+            self._pending_sync_timer = loop.call_later(
+                self.SYNC_DEBOUNCE_SECONDS,
+                lambda: asyncio.create_task(self._run_sync(msg, full))
+            )
 
-            async with self.bolt_client:
-                result = await self.bolt_client.sync_database(full_sync=full)
+        except Exception as e:
+            logger.error(f"Sync command failed: {e}")
+            await ctx.send(f"❌ Sync failed: {str(e)}")
+
+    @timed
+    async def _run_sync(self, msg, full: bool):
+        """Run the debounced sync and edit the status message with the result"""
+        self._pending_sync_timer = None
+        self._pending_sync_msg = None
+        try:
+            await msg.edit(content="🔄 Starting database sync...")
+
+            # Single-flight: concurrent kicks queue up behind one sync
+            async with self._sync_lock:
+                with track('api'):
+                    result = await self.bolt_client.sync_database(full_sync=full, batch_size=500)
+
+            # Fresh data invalidates cached embeds for the affected periods
+            self.invalidate_stats_cache(result.get('earliest_changed_ts'))
+            self.invalidate_drivers_cache()
 
             embed = discord.Embed(
                 title="✅ Database Sync Complete",
                 color=0x00ff00,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             )
 
             embed.add_field(name="New Orders", value=result['new_orders'], inline=True)
@@ -1052,13 +1558,11 @@ class FleetCommands(commands.Cog):
                 inline=False
             )
 
-            await ctx.send(embed=embed)
+            await msg.edit(content=None, embed=embed)
 
-        except commands.CommandOnCooldown as e:
-            await ctx.send(f"⏰ Sync is on cooldown. Try again in {e.retry_after:.0f} seconds.")
         except Exception as e:
-            logger.error(f"Sync command failed: {e}")
-            await ctx.send(f"❌ Sync failed: {str(e)}")
+            logger.error(f"Sync failed: {e}")
+            await msg.edit(content=f"❌ Sync failed: {str(e)}")
 
 
 async def setup(bot):
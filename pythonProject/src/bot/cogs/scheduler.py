@@ -1,28 +1,130 @@
 # src/bot/cogs/scheduler.py
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from collections import defaultdict
+
+import asyncio
 
 import discord
 from discord.ext import commands, tasks
-from datetime import datetime, time, timezone, timedelta
+from datetime import datetime, date, time, timezone, timedelta
+from functools import lru_cache
+from time import monotonic
 import logging
 import json
+import os
+import sys
 from pathlib import Path
-import pytz
+from zoneinfo import ZoneInfo
+
+# Resolved once at import; ZoneInfo instances are cached process-wide
+ROMANIA_TZ = ZoneInfo('Europe/Bucharest')
+
+
+def _seconds_until_bucharest_midnight() -> float:
+    """Seconds from now until the next Europe/Bucharest midnight.
+
+    Computed on aware datetimes, so the result is correct across DST
+    transitions (a "day" may be 23 or 25 hours long).
+    """
+    now = datetime.now(ROMANIA_TZ)
+    next_midnight = datetime.combine(now.date() + timedelta(days=1), time.min, tzinfo=ROMANIA_TZ)
+    return (next_midnight - now).total_seconds()
+
+
+def _nearest_bucharest_midnight(moment: datetime) -> datetime:
+    """The Europe/Bucharest midnight closest to an aware timestamp.
+
+    Lets a report iteration that fires slightly before or after midnight
+    resolve to the midnight it was scheduled for.
+    """
+    day_start = datetime.combine(moment.date(), time.min, tzinfo=ROMANIA_TZ)
+    if moment - day_start >= timedelta(hours=12):
+        return day_start + timedelta(days=1)
+    return day_start
+
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    # orjson is a few times faster, but the stdlib handles these small
+    # config files fine if it isn't installed
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode()
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _report_date_text(day: date) -> str:
+    """Long-form report date; formatted once per day across both reports"""
+    return day.strftime('%A, %B %d, %Y')
+
+
+# Field body for the per-driver earnings block; format_map straight off
+# the stats dict avoids per-driver tuple/join work in the report loop
+EARNINGS_TMPL = (
+    "**Gross:** {gross_earnings} RON\n"
+    "**Net:** {net_earnings} RON\n"
+    "**💵 Cash:** {cash_collected} RON"
+)
+
+
 class ScheduledTasks(commands.Cog):
     """Scheduled tasks for periodic updates and reports"""
 
+    # How long fetched report data stays valid, so a re-triggered
+    # test report doesn't repeat the API fetch and aggregation. Reports
+    # cover a closed (yesterday) day, so a longer window is safe: the
+    # underlying data only changes when a sync backfills old orders.
+    REPORT_DATA_TTL = 300.0
+
+    # Roster lookups for set-driver-channel; admins register drivers in
+    # bursts, so one fetch covers the whole burst
+    DRIVERS_TTL = 60.0
+
+    # Adaptive sync cadence: fast while orders are landing, exponentially
+    # backed off (up to 40 min) through quiet stretches
+    SYNC_ACTIVE_INTERVAL = 60.0
+    SYNC_IDLE_CAP = 2400.0
+
     def __init__(self, bot):
         self.bot = bot
         self.bolt_client = bot.bolt_client
         self.report_channel_id = None  # Main report channel for summary
         self.driver_channels = {}  # Will store driver_uuid -> channel_id mapping
-        self.config_file = Path("data/driver_channels.json")
+        self.config_file = Path("data/driver_channels.json")  # legacy, migrated to SQLite
         self.settings_file = Path("data/scheduler_settings.json")
 
+        # report day -> (expires_at, driver_stats, state_logs)
+        self._report_data_cache = {}
+
+        # Resolved channel objects; get_channel walks the bot's cache on
+        # every call, so resolve each id once until a channel disappears
+        self._channel_cache: Dict[int, discord.abc.Messageable] = {}
+
+        # Background startup sync, spawned once the bot is ready
+        self._initial_sync_task = None
+
+        # (fetched_at, rows) for the driver roster, or None
+        self._drivers_cache = None
+
+        # Current adaptive sync interval in seconds; starts at the loop
+        # default and adjusts after every tick
+        self._sync_interval = 600.0
+
+        # In-flight coalescing: concurrent duplicate fetches (e.g. the
+        # scheduled report and !test-midnight-report firing together)
+        # await one shared task instead of hitting the API twice
+        self._inflight: Dict[Any, asyncio.Task] = {}
+
         # Ensure data directory exists
         self.config_file.parent.mkdir(exist_ok=True)
 
@@ -36,25 +138,41 @@ class ScheduledTasks(commands.Cog):
 
         logger.info("Scheduler initialized with tasks")
 
+    def _resolve_channel(self, channel_id: Optional[int]):
+        """Memoized bot.get_channel; unresolvable ids are retried next call"""
+        if channel_id is None:
+            return None
+        channel = self._channel_cache.get(channel_id)
+        if channel is None:
+            channel = self.bot.get_channel(channel_id)
+            if channel is not None:
+                self._channel_cache[channel_id] = channel
+        return channel
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """Drop deleted channels so reports don't target dead objects"""
+        self._channel_cache.pop(channel.id, None)
+
     def load_settings(self):
         """Load scheduler settings including report channel"""
         if self.settings_file.exists():
             try:
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
-                    self.report_channel_id = settings.get('report_channel_id')
-                    logger.info(f"Loaded settings: report_channel={self.report_channel_id}")
+                settings = _json_loads(self.settings_file.read_bytes())
+                self.report_channel_id = settings.get('report_channel_id')
+                logger.info(f"Loaded settings: report_channel={self.report_channel_id}")
             except Exception as e:
                 logger.error(f"Failed to load settings: {e}")
 
     def save_settings(self):
-        """Save scheduler settings"""
+        """Save scheduler settings (atomic tmp-file + rename)"""
         try:
             settings = {
                 'report_channel_id': self.report_channel_id
             }
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            tmp = self.settings_file.with_suffix('.tmp')
+            tmp.write_bytes(_json_dumps(settings))
+            os.replace(tmp, self.settings_file)
             logger.info("Saved scheduler settings")
         except Exception as e:
             logger.error(f"Failed to save settings: {e}")
@@ -63,62 +181,109 @@ class ScheduledTasks(commands.Cog):
         """Cancel tasks when cog is unloaded"""
         self.sync_database.cancel()
         self.midnight_report.cancel()
+        if self._initial_sync_task:
+            self._initial_sync_task.cancel()
 
     def load_driver_channels(self):
-        """Load driver channel mappings from file"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    self.driver_channels = json.load(f)
-                logger.info(f"Loaded {len(self.driver_channels)} driver channel mappings")
-            except Exception as e:
-                logger.error(f"Failed to load driver channels: {e}")
-                self.driver_channels = {}
+        """Load driver channel mappings from the database.
+
+        Mappings used to live in driver_channels.json; an existing file is
+        migrated into the driver_channels table once and then removed, so
+        there is a single durable source of truth with O(1) upserts.
+        """
+        try:
+            # Interned keys make the nightly per-driver membership checks
+            # identity-compare fast paths instead of full string hashing
+            self.driver_channels = {
+                sys.intern(k): v
+                for k, v in self.bolt_client.db.get_driver_channels().items()
+            }
+
+            if self.config_file.exists():
+                legacy = _json_loads(self.config_file.read_bytes())
+                if legacy:
+                    self.bolt_client.db.set_driver_channels(legacy)
+                    self.driver_channels.update(
+                        (sys.intern(k), v) for k, v in legacy.items()
+                    )
+                self.config_file.unlink()
+                logger.info(f"Migrated {len(legacy)} driver channel mappings from JSON to SQLite")
 
-    def save_driver_channels(self):
-        """Save driver channel mappings to file"""
+            logger.info(f"Loaded {len(self.driver_channels)} driver channel mappings")
+        except Exception as e:
+            logger.error(f"Failed to load driver channels: {e}")
+
+    def _drivers(self):
+        """Driver roster with a short TTL so command bursts fetch once"""
+        cache = self._drivers_cache
+        if cache and monotonic() - cache[0] < self.DRIVERS_TTL:
+            return cache[1]
+        drivers = self.bolt_client.db.get_all_drivers()
+        self._drivers_cache = (monotonic(), drivers)
+        return drivers
+
+    def save_driver_channel(self, driver_uuid: str, channel_id: int):
+        """Persist one mapping: a single-row SQLite upsert"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.driver_channels, f, indent=2)
-            logger.info("Saved driver channel mappings")
+            self.bolt_client.db.set_driver_channel(driver_uuid, channel_id)
+            logger.info("Saved driver channel mapping")
         except Exception as e:
-            logger.error(f"Failed to save driver channels: {e}")
+            logger.error(f"Failed to save driver channel: {e}")
 
     @tasks.loop(minutes=10)
     async def sync_database(self):
-        """Sync database every 10 minutes"""
+        """Sync the database on an adaptive interval.
+
+        Quiet ticks (no new orders, or a failed sync) double the interval
+        up to SYNC_IDLE_CAP so night hours stop burning API calls; a tick
+        that lands orders snaps back to SYNC_ACTIVE_INTERVAL for fast
+        catch-up while the fleet is driving.
+        """
+        new_orders = 0
         try:
             logger.info("Starting scheduled database sync...")
 
-            async with self.bolt_client:
-                result = await self.bolt_client.sync_database(full_sync=False)
+            result = await self._single_flight(
+                'sync', lambda: self.bolt_client.sync_database(full_sync=False)
+            )
+            new_orders = result['new_orders']
 
             if result['new_orders'] > 0:
                 logger.info(f"Database sync completed: {result['new_orders']} new orders added")
 
+                # New data invalidates the fleet cog's roster/stats caches;
+                # only periods covering the changed orders are dropped
+                self._drivers_cache = None
+                fleet_cog = self.bot.get_cog("FleetCommands")
+                if fleet_cog:
+                    fleet_cog.invalidate_drivers_cache()
+                    fleet_cog.invalidate_stats_cache(result.get('earliest_changed_ts'))
+
                 # Notify if significant new orders
                 if result['new_orders'] > 10 and self.report_channel_id:
-                    channel = self.bot.get_channel(self.report_channel_id)
+                    channel = self._resolve_channel(self.report_channel_id)
                     if channel:
                         await channel.send(f"📊 Database updated: {result['new_orders']} new orders synced")
 
         except Exception as e:
             logger.error(f"Database sync failed: {e}", exc_info=True)
+        finally:
+            if new_orders > 0:
+                self._sync_interval = self.SYNC_ACTIVE_INTERVAL
+            else:
+                self._sync_interval = min(self._sync_interval * 2, self.SYNC_IDLE_CAP)
+            self.sync_database.change_interval(seconds=self._sync_interval)
 
-    @tasks.loop(time=[time(hour=21, minute=0), time(hour=22, minute=0)])  # 21:00 and 22:00 UTC to handle DST
+    @tasks.loop(hours=24)  # re-aimed at the next Bucharest midnight after each run
     async def midnight_report(self):
         """Send daily reports at midnight Romania time"""
+        # Captured before any awaits: change_interval anchors the next
+        # iteration at this iteration's *scheduled start*, so the re-aim in
+        # the finally block must measure from here — measuring at the end of
+        # the body would pull every subsequent fire earlier by the body's
+        # runtime
+        now_romania = datetime.now(ROMANIA_TZ)
         try:
-            # Get current time in Romania
-            romania_tz = pytz.timezone('Europe/Bucharest')
-            now_romania = datetime.now(romania_tz)
-
-            # Check if it's actually around midnight in Romania (23:55 - 00:05)
-            if not (now_romania.hour == 23 and now_romania.minute >= 55) and not (
-                    now_romania.hour == 0 and now_romania.minute <= 5):
-                logger.info(f"Skipping report - Romania time is {now_romania.strftime('%H:%M')}, not midnight")
-                return
-
             logger.info(f"Starting midnight report generation at {now_romania.strftime('%Y-%m-%d %H:%M:%S %Z')}")
 
             # Check if report channel is configured
@@ -126,29 +291,17 @@ class ScheduledTasks(commands.Cog):
                 logger.error("Report channel not configured! Use !set-report-channel to configure")
                 return
 
-            # Get yesterday's date (since we're running at midnight)
-            yesterday = now_romania - timedelta(days=1)
-            report_date = yesterday.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+            # Report the day that just ended: round to the nearest midnight
+            # so a fire a few seconds early or late still picks the same day
+            midnight = _nearest_bucharest_midnight(now_romania)
+            report_date = datetime.combine(midnight.date() - timedelta(days=1), time.min)
 
-            # Fetch state logs for accurate hours calculation
-            async with self.bolt_client:
-                start_of_day = report_date
-                end_of_day = start_of_day + timedelta(days=1)
-
-                state_response = await self.bolt_client.get_fleet_state_logs(
-                    start_date=start_of_day,
-                    end_date=end_of_day,
-                    limit=1000
-                )
-                state_logs = state_response.get('data', {}).get('state_logs', []) if state_response.get(
-                    'code') == 0 else []
-
-            # Get enhanced daily stats using the same logic as driver-stats
-            driver_stats = self.get_enhanced_daily_stats(report_date, state_logs)
+            # Fetch state logs and aggregate stats (memoized per report day)
+            driver_stats, state_logs = await self._get_report_data(report_date)
 
             if not driver_stats:
                 logger.info("No driver activity for the report date")
-                channel = self.bot.get_channel(self.report_channel_id)
+                channel = self._resolve_channel(self.report_channel_id)
                 if channel:
                     await channel.send(f"📊 No driver activity on {report_date.strftime('%Y-%m-%d')}")
                 return
@@ -166,37 +319,114 @@ class ScheduledTasks(commands.Cog):
             # Try to notify about the error
             if self.report_channel_id:
                 try:
-                    channel = self.bot.get_channel(self.report_channel_id)
+                    channel = self._resolve_channel(self.report_channel_id)
                     if channel:
                         await channel.send(f"❌ Midnight report failed: {str(e)[:200]}")
                 except:
                     pass
+        finally:
+            # Re-aim at the midnight after the one this iteration was
+            # scheduled for, measured from the iteration start so it lines up
+            # with change_interval's scheduled-start anchoring; a plain 24h
+            # interval would also drift by an hour across DST transitions
+            target = _nearest_bucharest_midnight(now_romania) + timedelta(days=1)
+            self.midnight_report.change_interval(seconds=(target - now_romania).total_seconds())
+
+    async def _single_flight(self, key, coro_factory):
+        """Coalesce concurrent duplicate work: followers await the leader.
+
+        The first caller for a key runs the coroutine; anyone arriving
+        while it is still in flight awaits the same task (shielded, so a
+        cancelled follower doesn't abort the leader's fetch).
+        """
+        existing = self._inflight.get(key)
+        if existing is not None:
+            return await asyncio.shield(existing)
+        task = asyncio.ensure_future(coro_factory())
+        self._inflight[key] = task
+        try:
+            return await task
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _get_report_data(self, report_date: datetime):
+        """Fetch state logs and enhanced stats for one report day, memoized.
+
+        Admins iterating on formatting trigger !test-midnight-report
+        repeatedly; serving the same day from cache for a short window
+        makes the second run near-free, and concurrent requests for the
+        same day are coalesced into one fetch.
+        """
+        key = report_date.date()
+        entry = self._report_data_cache.get(key)
+        if entry and entry[0] > monotonic():
+            return entry[1], entry[2]
+
+        return await self._single_flight(
+            ('report', key), lambda: self._fetch_report_data(key, report_date)
+        )
+
+    async def _fetch_report_data(self, key, report_date: datetime):
+        # Paginated fetch: no 1000-log cap, and each page is a bounded
+        # allocation instead of one big response. The window is the same
+        # Romania-local day every other report query uses.
+        day_start = datetime.combine(report_date.date(), time.min, tzinfo=ROMANIA_TZ)
+        state_logs = []
+        try:
+            async for page in self.bolt_client.iter_fleet_state_logs(
+                    start_date=day_start,
+                    end_date=day_start + timedelta(days=1)):
+                state_logs.extend(page)
+        except Exception as e:
+            logger.warning(f"State log fetch failed, using partial data: {e}")
+
+        # Run the sqlite aggregation off the loop so the heartbeat and
+        # interactive commands stay responsive
+        driver_stats = await asyncio.to_thread(self.get_enhanced_daily_stats, report_date, state_logs)
+
+        # One day at a time is enough; replacing the dict evicts older days
+        self._report_data_cache = {key: (monotonic() + self.REPORT_DATA_TTL, driver_stats, state_logs)}
+        return driver_stats, state_logs
+
+    def get_enhanced_daily_stats(self, report_date: datetime, state_logs: List[Dict],
+                                 driver_uuids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get daily stats with proper hours calculation using the same logic as driver-stats.
 
-    def get_enhanced_daily_stats(self, report_date: datetime, state_logs: List[Dict]) -> List[Dict[str, Any]]:
-        """Get daily stats with proper hours calculation using the same logic as driver-stats"""
+        driver_uuids restricts the work to a subset of drivers at the SQL
+        layer; the report pipeline passes None because the fleet summary
+        consumes every row.
+        """
 
-        # Get all drivers who worked that day
-        basic_stats = self.bolt_client.db.get_driver_daily_stats(report_date)
+        # Get all drivers who worked that day (optionally filtered in SQL)
+        basic_stats = self.bolt_client.db.get_driver_daily_stats(report_date, driver_uuids)
 
         if not basic_stats:
             return []
 
         enhanced_stats = []
 
-        # Calculate date range for the day
-        start_date = report_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        # Group the logs once: the hours calculators filter by driver_uuid,
+        # so handing each driver only their own logs turns an O(drivers x
+        # logs) rescan into a single O(logs) pass
+        logs_by_driver = defaultdict(list)
+        for log in state_logs:
+            logs_by_driver[log.get('driver_uuid')].append(log)
+
+        # The report day is a Romania-local calendar day; aware bounds keep
+        # the hours window identical to the money stats and the rollups
+        # regardless of the host timezone
+        start_date = datetime.combine(report_date.date(), time.min, tzinfo=ROMANIA_TZ)
         end_date = start_date + timedelta(days=1)
 
+        # One set-oriented query covers every driver's hours instead of
+        # N per-driver round trips (the money figures are already bulk)
+        hours_by_driver = self.bolt_client.db.get_daily_hours_bulk(
+            start_date, end_date, logs_by_driver
+        )
+
         for driver in basic_stats:
             driver_uuid = driver['driver_uuid']
-
-            # Use the same comprehensive calculation as driver-stats
-            detailed_stats = self.bolt_client.db.get_driver_stats_by_date_range(
-                driver_uuid,
-                start_date,
-                end_date,
-                state_logs
-            )
+            detailed_stats = hours_by_driver.get(driver_uuid)
 
             if detailed_stats:
                 # Build enhanced stats combining both calculations
@@ -213,7 +443,10 @@ class ScheduledTasks(commands.Cog):
                     'total_online_hours': detailed_stats['total_online_hours'],  # Total online
                     'waiting_hours': detailed_stats['waiting_hours'],  # Waiting time
                     'earnings_per_hour': round(driver['gross_earnings'] / detailed_stats['total_online_hours'], 2) if
-                    detailed_stats['total_online_hours'] > 0 else 0
+                    detailed_stats['total_online_hours'] > 0 else 0,
+                    # Precomputed in SQL by get_driver_daily_stats
+                    'earnings_per_order': driver.get('earnings_per_order', 0),
+                    'earnings_per_km': driver.get('earnings_per_km', 0)
                 }
                 enhanced_stats.append(enhanced_driver)
             else:
@@ -228,27 +461,45 @@ class ScheduledTasks(commands.Cog):
             logger.warning("Main report channel ID not configured")
             return
 
-        channel = self.bot.get_channel(self.report_channel_id)
+        channel = self._resolve_channel(self.report_channel_id)
         if not channel:
             logger.error(f"Could not find main report channel {self.report_channel_id}")
             return
 
-        # Calculate totals using the enhanced stats
-        total_orders = sum(d['orders_completed'] for d in driver_stats)
-        total_gross = sum(d['gross_earnings'] for d in driver_stats)
-        total_net = sum(d['net_earnings'] for d in driver_stats)
-        total_cash = sum(d['cash_collected'] for d in driver_stats)
-        total_kms = sum(d['kms_traveled'] for d in driver_stats)
-
-        # Use total_online_hours if available, otherwise hours_worked
-        total_hours = sum(d.get('total_online_hours', d.get('hours_worked', 0)) for d in driver_stats)
-        total_active_hours = sum(d.get('hours_worked', 0) for d in driver_stats)
-        total_waiting_hours = sum(d.get('waiting_hours', 0) for d in driver_stats)
+        # One SQL aggregate over the daily rollups replaces the Python
+        # passes; hours always come from the state-log-enhanced stats
+        # (total_online_hours when available, otherwise hours_worked)
+        totals = await asyncio.to_thread(self.bolt_client.db.get_fleet_daily_totals, report_date.date())
+        total_hours = total_active_hours = total_waiting_hours = 0.0
+        if totals:
+            total_orders, total_gross, total_net, total_cash, total_kms = totals
+            for d in driver_stats:
+                get = d.get
+                total_hours += get('total_online_hours', get('hours_worked', 0))
+                total_active_hours += get('hours_worked', 0)
+                total_waiting_hours += get('waiting_hours', 0)
+            top_drivers = await asyncio.to_thread(self.bolt_client.db.get_top_drivers_for_day, report_date.date())
+        else:
+            # Rollups not built yet: one fused pass accumulates every
+            # total, and the ranking is still sorted and limited in SQLite
+            total_orders = 0
+            total_gross = total_net = total_cash = total_kms = 0.0
+            for d in driver_stats:
+                get = d.get
+                total_orders += d['orders_completed']
+                total_gross += d['gross_earnings']
+                total_net += d['net_earnings']
+                total_cash += d['cash_collected']
+                total_kms += d['kms_traveled']
+                total_hours += get('total_online_hours', get('hours_worked', 0))
+                total_active_hours += get('hours_worked', 0)
+                total_waiting_hours += get('waiting_hours', 0)
+            top_drivers = await asyncio.to_thread(self.bolt_client.db.get_top_drivers_by_gross, report_date)
 
         # Create summary embed
         embed = discord.Embed(
             title=f"📊 Daily Fleet Performance Report",
-            description=f"Date: {report_date.strftime('%A, %B %d, %Y')}",
+            description=f"Date: {_report_date_text(report_date.date())}",
             color=0x00d4aa,
             timestamp=datetime.now(timezone.utc)
         )
@@ -264,37 +515,38 @@ class ScheduledTasks(commands.Cog):
 
         embed.add_field(
             name="📈 Fleet Totals",
-            value=(
-                f"**Total Orders:** {total_orders}\n"
-                f"**Gross Earnings:** {total_gross:.2f} RON\n"
-                f"**Net Earnings:** {total_net:.2f} RON\n"
-                f"**Cash Collected:** {total_cash:.2f} RON\n"
-                f"**Total Distance:** {total_kms:.1f} km\n"
-                f"{hours_display}"
-            ),
+            value="\n".join((
+                f"**Total Orders:** {total_orders}",
+                f"**Gross Earnings:** {total_gross:.2f} RON",
+                f"**Net Earnings:** {total_net:.2f} RON",
+                f"**Cash Collected:** {total_cash:.2f} RON",
+                f"**Total Distance:** {total_kms:.1f} km",
+                hours_display,
+            )),
             inline=False
         )
 
         # Fleet averages
         if total_orders > 0 and total_hours > 0:
+            avg_lines = [
+                f"**Avg per Order:** {total_gross / total_orders:.2f} RON",
+                f"**Avg per Hour (Total):** {total_gross / total_hours:.2f} RON/hr",
+            ]
+            if total_active_hours > 0:
+                avg_lines.append(f"**Avg per Hour (Active):** {total_gross / total_active_hours:.2f} RON/hr")
+            if total_kms > 0:
+                avg_lines.append(f"**Avg per KM:** {total_gross / total_kms:.2f} RON/km")
             embed.add_field(
                 name="📊 Fleet Averages",
-                value=(
-                    f"**Avg per Order:** {total_gross / total_orders:.2f} RON\n"
-                    f"**Avg per Hour (Total):** {total_gross / total_hours:.2f} RON/hr\n"
-                    f"**Avg per Hour (Active):** {total_gross / total_active_hours:.2f} RON/hr\n" if total_active_hours > 0 else "" +
-                                                                                                                                 f"**Avg per KM:** {total_gross / total_kms:.2f} RON/km" if total_kms > 0 else f"**Avg per Order:** {total_gross / total_orders:.2f} RON"
-                ),
+                value="\n".join(avg_lines),
                 inline=False
             )
 
         # Driver summary
-        driver_summary = []
-        for driver in sorted(driver_stats, key=lambda x: x['gross_earnings'], reverse=True)[:5]:
-            driver_summary.append(
-                f"• **{driver['driver_name']}**: {driver['orders_completed']} orders, "
-                f"{driver['gross_earnings']:.2f} RON"
-            )
+        driver_summary = [
+            f"• **{name}**: {orders} orders, {gross:.2f} RON"
+            for name, orders, gross in top_drivers
+        ]
 
         if driver_summary:
             embed.add_field(
@@ -309,9 +561,29 @@ class ScheduledTasks(commands.Cog):
 
     async def send_individual_reports(self, driver_stats, report_date, state_logs):
         """Send individual reports to each driver's channel with enhanced stats"""
-        for driver in driver_stats:
+        # Build all embeds first, grouped by destination channel, so each
+        # channel needs as few sends as possible (up to 10 embeds/message)
+        embeds_by_channel: Dict[int, List[discord.Embed]] = {}
+        drivers_by_channel: Dict[int, List[Dict[str, Any]]] = {}
+
+        # Everything but the description is identical across drivers, so
+        # build the skeleton once and copy() it per driver
+        now = datetime.now(timezone.utc)
+        date_text = _report_date_text(report_date.date())
+        template = discord.Embed(
+            title="📊 Daily Performance Report",
+            color=0x0099ff,
+            timestamp=now
+        )
+        template.set_footer(text="DesiSquad Fleet Management • Keep up the great work!")
+
+        for i, driver in enumerate(driver_stats):
+            if i and i % 50 == 0:
+                # Yield between batches of pure-CPU embed building so the
+                # heartbeat and interactive commands stay responsive
+                await asyncio.sleep(0)
             try:
-                driver_uuid = driver['driver_uuid']
+                driver_uuid = sys.intern(driver['driver_uuid'])
 
                 # Skip if no channel configured for this driver
                 if driver_uuid not in self.driver_channels:
@@ -319,31 +591,27 @@ class ScheduledTasks(commands.Cog):
                     continue
 
                 channel_id = self.driver_channels[driver_uuid]
-                channel = self.bot.get_channel(channel_id)
 
-                if not channel:
-                    logger.warning(f"Could not find channel {channel_id} for driver {driver['driver_name']}")
-                    continue
+                # Bind the hot fields to locals once instead of re-hashing
+                # the dict for every embed line
+                orders = driver['orders_completed']
+                gross = driver['gross_earnings']
+                kms = driver['kms_traveled']
+                cash_collected = driver['cash_collected']
+                active_hours = driver.get('hours_worked', 0)
+                online_hours = driver.get('total_online_hours')
 
                 # Create personalized embed with enhanced hours display
-                embed = discord.Embed(
-                    title=f"📊 Daily Performance Report",
-                    description=f"Driver: **{driver['driver_name']}**\nDate: {report_date.strftime('%A, %B %d, %Y')}",
-                    color=0x0099ff,
-                    timestamp=datetime.now(timezone.utc)
-                )
+                embed = template.copy()
+                embed.description = f"Driver: **{driver['driver_name']}**\nDate: {date_text}"
 
                 # Format hours display
-                if 'total_online_hours' in driver:
+                if online_hours is not None:
                     # We have enhanced stats
-                    active_h = int(driver['hours_worked'])
-                    active_m = int((driver['hours_worked'] - active_h) * 60)
-
-                    total_h = int(driver['total_online_hours'])
-                    total_m = int((driver['total_online_hours'] - total_h) * 60)
-
-                    waiting_h = int(driver['waiting_hours'])
-                    waiting_m = int((driver['waiting_hours'] - waiting_h) * 60)
+                    waiting_hours = driver['waiting_hours']
+                    active_h, active_m = divmod(int(active_hours * 60), 60)
+                    total_h, total_m = divmod(int(online_hours * 60), 60)
+                    waiting_h, waiting_m = divmod(int(waiting_hours * 60), 60)
 
                     hours_display = (
                         f"**Total Online:** {total_h}h {total_m}m\n"
@@ -352,92 +620,152 @@ class ScheduledTasks(commands.Cog):
                     )
                 else:
                     # Basic stats only
-                    hours_display = f"**Hours Worked:** {driver['hours_worked']} hrs"
+                    hours_display = f"**Hours Worked:** {active_hours} hrs"
 
                 # Performance metrics
                 embed.add_field(
                     name="🚗 Activity",
-                    value=(
-                        f"**Orders Completed:** {driver['orders_completed']}\n"
-                        f"{hours_display}\n"
-                        f"**Distance Traveled:** {driver['kms_traveled']} km"
-                    ),
+                    value="\n".join((
+                        f"**Orders Completed:** {orders}",
+                        hours_display,
+                        f"**Distance Traveled:** {kms} km",
+                    )),
                     inline=False
                 )
 
                 # Earnings
                 embed.add_field(
                     name="💰 Earnings",
-                    value=(
-                        f"**Gross:** {driver['gross_earnings']} RON\n"
-                        f"**Net:** {driver['net_earnings']} RON\n"
-                        f"**💵 Cash:** {driver['cash_collected']} RON"
-                    ),
+                    value=EARNINGS_TMPL.format_map(driver),
                     inline=True
                 )
 
                 # Efficiency metrics
-                if driver.get('total_online_hours', driver.get('hours_worked', 0)) > 0 and driver[
-                    'orders_completed'] > 0:
-                    hours_for_calc = driver.get('total_online_hours', driver['hours_worked'])
-
-                    # Calculate both total and active earnings per hour if we have the data
-                    if 'hours_worked' in driver and 'total_online_hours' in driver:
-                        earnings_text = (
-                            f"**Per Hour (Total):** {driver['gross_earnings'] / driver['total_online_hours']:.2f} RON/hr\n"
-                            f"**Per Hour (Active):** {driver['gross_earnings'] / driver['hours_worked']:.2f} RON/hr\n" if
-                            driver['hours_worked'] > 0 else ""
-                        )
+                if (online_hours if online_hours is not None else active_hours) > 0 and orders > 0:
+                    efficiency_lines = []
+                    if online_hours is not None:
+                        if online_hours > 0:
+                            efficiency_lines.append(
+                                f"**Per Hour (Total):** {gross / online_hours:.2f} RON/hr")
+                        if active_hours > 0:
+                            efficiency_lines.append(
+                                f"**Per Hour (Active):** {gross / active_hours:.2f} RON/hr")
                     else:
-                        earnings_text = f"**Per Hour:** {driver['earnings_per_hour']} RON/hr\n"
+                        efficiency_lines.append(f"**Per Hour:** {driver['earnings_per_hour']} RON/hr")
+                    # Ratios are precomputed by the daily stats query
+                    per_order = driver.get('earnings_per_order', gross / orders)
+                    efficiency_lines.append(f"**Per Order:** {per_order:.2f} RON")
+                    if kms > 0:
+                        per_km = driver.get('earnings_per_km', gross / kms)
+                        efficiency_lines.append(f"**Per KM:** {per_km:.2f} RON/km")
 
                     embed.add_field(
                         name="📈 Efficiency",
-                        value=(
-                            f"{earnings_text}"
-                            f"**Per Order:** {driver['gross_earnings'] / driver['orders_completed']:.2f} RON\n"
-                            f"**Per KM:** {driver['gross_earnings'] / driver['kms_traveled']:.2f} RON/km" if driver[
-                                                                                                                 'kms_traveled'] > 0 else f"{earnings_text}**Per Order:** {driver['gross_earnings'] / driver['orders_completed']:.2f} RON"
-                        ),
+                        value="\n".join(efficiency_lines),
                         inline=True
                     )
 
                 # Cash collection warning
-                if driver['cash_collected'] > 0:
+                if cash_collected > 0:
                     embed.add_field(
                         name="⚠️ Cash Collection Required",
-                        value=f"Please remit **{driver['cash_collected']} RON** in cash",
+                        value=f"Please remit **{cash_collected} RON** in cash",
                         inline=False
                     )
                     embed.color = 0xff9500  # Orange for cash collection
 
-                embed.set_footer(text="DesiSquad Fleet Management • Keep up the great work!")
-
-                await channel.send(embed=embed)
-                logger.info(f"Sent report to {driver['driver_name']}")
+                embeds_by_channel.setdefault(channel_id, []).append(embed)
+                drivers_by_channel.setdefault(channel_id, []).append(driver)
 
             except Exception as e:
-                logger.error(f"Failed to send report to driver {driver.get('driver_name', 'Unknown')}: {e}")
+                logger.error(f"Failed to build report for driver {driver.get('driver_name', 'Unknown')}: {e}")
+
+        # A channel shared by many drivers (e.g. one test channel for the
+        # whole fleet) would still need several multi-embed messages; above
+        # ten drivers, collapse to digest embeds with one field per driver
+        # (25 fields per embed), so the channel gets a single send
+        for channel_id, drivers in drivers_by_channel.items():
+            if len(drivers) <= 10:
+                continue
+            digests = []
+            digest = None
+            for driver in drivers:
+                if digest is None or len(digest.fields) >= 25:
+                    digest = template.copy()
+                    digest.description = f"Date: {date_text}"
+                    digests.append(digest)
+                get = driver.get
+                hours = get('total_online_hours', get('hours_worked', 0))
+                cash_collected = driver['cash_collected']
+                summary = (
+                    f"**Orders:** {driver['orders_completed']} • "
+                    f"**Gross:** {driver['gross_earnings']} RON • "
+                    f"**Hours:** {hours:.1f}"
+                )
+                if cash_collected > 0:
+                    summary += f"\n⚠️ Cash to remit: **{cash_collected} RON**"
+                digest.add_field(name=f"👤 {driver['driver_name']}", value=summary, inline=False)
+            embeds_by_channel[channel_id] = digests
+
+        # One REST call per 10 embeds instead of one per driver; different
+        # channels go out concurrently so total wall time is ~one RTT, with
+        # a semaphore to stay clear of Discord's global rate limit
+        send_sem = asyncio.Semaphore(10)
+
+        async def send_to_channel(channel_id: int, embeds: List[discord.Embed]):
+            channel = self._resolve_channel(channel_id)
+            if not channel:
+                logger.warning(f"Could not find channel {channel_id} for driver reports")
+                return
+            try:
+                for i in range(0, len(embeds), 10):
+                    async with send_sem:
+                        await channel.send(embeds=embeds[i:i + 10])
+                logger.info(f"Sent {len(embeds)} driver report(s) to channel {channel_id}")
+            except Exception as e:
+                logger.error(f"Failed to send driver reports to channel {channel_id}: {e}")
+
+        results = await asyncio.gather(
+            *(send_to_channel(cid, embeds) for cid, embeds in embeds_by_channel.items()),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Driver report send failed: {result}")
 
     @sync_database.before_loop
     async def before_sync_database(self):
         """Wait for bot to be ready before starting sync"""
         await self.bot.wait_until_ready()
 
-        # Do initial sync on startup
+        # Kick the initial sync off in the background so the periodic
+        # loop starts ticking immediately instead of waiting behind the
+        # first full API pass (!force-sync is available if it's urgent)
+        self._initial_sync_task = asyncio.create_task(self._do_initial_sync())
+
+    async def _do_initial_sync(self):
+        """Startup sync, run as a background task"""
         logger.info("Performing initial database sync...")
         try:
-            async with self.bolt_client:
-                result = await self.bolt_client.sync_database(full_sync=False)
+            result = await self._single_flight(
+                'sync', lambda: self.bolt_client.sync_database(full_sync=False)
+            )
             logger.info(f"Initial sync complete: {result['new_orders']} new orders")
         except Exception as e:
             logger.error(f"Initial sync failed: {e}")
 
     @midnight_report.before_loop
     async def before_midnight_report(self):
-        """Wait for bot to be ready before starting midnight reports"""
+        """Sleep until the next Bucharest midnight, then fire once a day.
+
+        The loop used to tick at 21:00 and 22:00 UTC and throw away the
+        eleven-out-of-twelve wakeups that weren't Romanian midnight; one
+        computed sleep replaces all of that.
+        """
         await self.bot.wait_until_ready()
-        logger.info("Midnight report task is ready")
+        delay = _seconds_until_bucharest_midnight()
+        logger.info(f"Midnight report scheduled in {delay / 3600:.1f}h")
+        await asyncio.sleep(delay)
 
     # Command to set main report channel
     @commands.command(name="set-report-channel")
@@ -446,7 +774,8 @@ class ScheduledTasks(commands.Cog):
         """Set the channel for main fleet reports"""
         channel = channel or ctx.channel
         self.report_channel_id = channel.id
-        self.save_settings()  # Persist the setting
+        self._channel_cache[channel.id] = channel  # already resolved, seed cache
+        await asyncio.to_thread(self.save_settings)  # disk write off the event loop
 
         await ctx.send(f"✅ Main report channel set to {channel.mention}")
         logger.info(f"Main report channel set to {channel.id} by {ctx.author}")
@@ -459,7 +788,7 @@ class ScheduledTasks(commands.Cog):
         channel = channel or ctx.channel
 
         # Get driver UUID from number
-        drivers = self.bolt_client.db.get_all_drivers()
+        drivers = self._drivers()
         if driver_number < 1 or driver_number > len(drivers):
             await ctx.send("❌ Invalid driver number. Use !drivers to see the list.")
             return
@@ -468,8 +797,9 @@ class ScheduledTasks(commands.Cog):
         driver_name = drivers[driver_number - 1][2]
 
         # Save mapping
-        self.driver_channels[driver_uuid] = channel.id
-        self.save_driver_channels()
+        self.driver_channels[sys.intern(driver_uuid)] = channel.id
+        self._channel_cache[channel.id] = channel  # already resolved, seed cache
+        self.save_driver_channel(driver_uuid, channel.id)
 
         await ctx.send(f"✅ Reports for **{driver_name}** will be sent to {channel.mention}")
         logger.info(f"Driver channel set: {driver_name} -> {channel.id}")
@@ -488,26 +818,13 @@ class ScheduledTasks(commands.Cog):
                 return
 
             # Get yesterday's data for test
-            romania_tz = pytz.timezone('Europe/Bucharest')
-            now_romania = datetime.now(romania_tz)
+            now_romania = datetime.now(ROMANIA_TZ)
             yesterday = now_romania - timedelta(days=1)
             report_date = yesterday.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
 
-            # Fetch state logs
-            async with self.bolt_client:
-                start_of_day = report_date
-                end_of_day = start_of_day + timedelta(days=1)
-
-                state_response = await self.bolt_client.get_fleet_state_logs(
-                    start_date=start_of_day,
-                    end_date=end_of_day,
-                    limit=1000
-                )
-                state_logs = state_response.get('data', {}).get('state_logs', []) if state_response.get(
-                    'code') == 0 else []
-
-            # Get daily stats
-            driver_stats = self.get_enhanced_daily_stats(report_date, state_logs)
+            # Fetch state logs and aggregate stats (memoized, so repeat
+            # test runs while tweaking formatting are near-free)
+            driver_stats, state_logs = await self._get_report_data(report_date)
 
             if not driver_stats:
                 await ctx.send(f"📊 No driver activity on {report_date.strftime('%Y-%m-%d')}")
@@ -531,8 +848,9 @@ class ScheduledTasks(commands.Cog):
         try:
             await ctx.send("🔄 Starting forced sync...")
 
-            async with self.bolt_client:
-                result = await self.bolt_client.sync_database(full_sync=False)
+            result = await self._single_flight(
+                'sync', lambda: self.bolt_client.sync_database(full_sync=False)
+            )
 
             await ctx.send(f"✅ Sync complete: {result['new_orders']} new orders, {result['updated_orders']} updated")
 
@@ -545,16 +863,16 @@ class ScheduledTasks(commands.Cog):
     @commands.has_permissions(administrator=True)
     async def scheduler_status(self, ctx):
         """Check the status of scheduled tasks"""
+        # One clock read; Romania time is derived from it
+        now_utc = datetime.now(timezone.utc)
+        now_romania = now_utc.astimezone(ROMANIA_TZ)
+
         embed = discord.Embed(
             title="⏰ Scheduler Status",
             color=0x00ff00,
-            timestamp=datetime.now(timezone.utc)
+            timestamp=now_utc
         )
 
-        # Get Romania time
-        romania_tz = pytz.timezone('Europe/Bucharest')
-        now_romania = datetime.now(romania_tz)
-
         embed.add_field(
             name="Current Time",
             value=f"Romania: {now_romania.strftime('%Y-%m-%d %H:%M:%S %Z')}",
@@ -588,7 +906,7 @@ class ScheduledTasks(commands.Cog):
         )
 
         # Channel configuration
-        main_channel = self.bot.get_channel(self.report_channel_id) if self.report_channel_id else None
+        main_channel = self._resolve_channel(self.report_channel_id)
         embed.add_field(
             name="Channel Configuration",
             value=(
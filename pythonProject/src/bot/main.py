@@ -41,6 +41,12 @@ class BoltFleetBot(commands.Bot):
         """Setup bot and load extensions"""
         logger.info("Setting up bot...")
 
+        # Initialize the long-lived Bolt client once for the bot session
+        try:
+            await self.bolt_client.start()
+        except Exception as e:
+            logger.error(f"Failed to initialize Bolt client: {e}")
+
         # Load cogs
         extensions = [
             'src.bot.cogs.fleet',
@@ -1,15 +1,75 @@
+import asyncio
 import sqlite3
 import json
 import logging
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta, date, time as dt_time
+from functools import lru_cache
+from operator import methodcaller
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
-import pytz
+from zoneinfo import ZoneInfo
 from datetime import datetime, timedelta
 
+ROMANIA_TZ = ZoneInfo('Europe/Bucharest')
+
+# C-level sort key for state logs; keeps the .get default for odd rows
+_by_created = methodcaller('get', 'created', 0)
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _date_range_for_days(days: Optional[int], today: date) -> Tuple[datetime, datetime]:
+    """Pure 'days preset -> (start, end)' computation, cached per calendar day.
+
+    Keying on today's date means the handful of common presets (1, 7, 30
+    days, all time) are computed once and the cache refreshes naturally
+    at midnight.
+    """
+    if not days:
+        # All time - use company start date
+        return datetime(2024, 7, 28), datetime.combine(today, dt_time.max)
+
+    # For "1 day" we want today only; for N days, today plus N-1 previous days
+    start = datetime.combine(today, dt_time.min) - timedelta(days=days - 1)
+    return start, datetime.combine(today, dt_time.max)
+
+
+@dataclass(frozen=True, slots=True)
+class DriverStats:
+    """Aggregated per-driver statistics for a reporting period"""
+    driver_name: str
+    orders_completed: int
+    gross_earnings: float
+    net_earnings: float
+    total_distance: float
+    hours_worked: float
+    ride_hours: float
+    waiting_hours: float
+    earnings_per_hour: float
+    earnings_per_km: float
+    avg_distance: float
+    cash_collected: float
+    date_range: str
+
+
+@dataclass(frozen=True, slots=True)
+class CompanyStats:
+    """Aggregated company-wide statistics for a reporting period"""
+    trips_completed: int
+    gross_earnings: float
+    total_fees: float
+    net_earnings: float
+    total_distance: float
+    avg_distance: float
+    earnings_per_trip: float
+    earnings_per_km: float
+    avg_rating: float
+    cash_collected: float
+    driver_breakdown: List[Dict[str, Any]]
+
+
 class FleetDatabase:
     """
     Enhanced database with corrected hours worked and cash collection tracking
@@ -24,9 +84,20 @@ class FleetDatabase:
         self.db_path = Path(db_path)
         self.init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with WAL journaling and relaxed fsync.
+
+        WAL + synchronous=NORMAL keeps writes durable enough for our workload
+        while avoiding a full fsync per transaction (big win during sync).
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
     def init_database(self):
         """Initialize database with proper indexes and all required columns"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             # Main orders table - the source of truth
@@ -66,11 +137,57 @@ class FleetDatabase:
                 )
             ''')
 
+            # Per-driver daily rollups (Romania-local days) so long-range
+            # queries sum a handful of rows instead of scanning orders
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS driver_daily_agg (
+                    driver_uuid TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    driver_name TEXT,
+                    orders_completed INTEGER,
+                    gross_earnings REAL,
+                    net_earnings REAL,
+                    cash_collected REAL,
+                    total_distance REAL,
+                    active_hours REAL,
+                    waiting_hours REAL,
+                    PRIMARY KEY (driver_uuid, day)
+                )
+            ''')
+
+            # Cached fleet state logs so repeat historical queries skip the API
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS state_logs_cache (
+                    driver_uuid TEXT NOT NULL,
+                    created INTEGER NOT NULL,
+                    state TEXT,
+                    PRIMARY KEY (driver_uuid, created, state)
+                )
+            ''')
+
+            # Ranges that were fetched in full and can be served from cache
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS state_log_coverage (
+                    start_ts INTEGER NOT NULL,
+                    end_ts INTEGER NOT NULL,
+                    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Driver report channel mappings (replaces driver_channels.json)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS driver_channels (
+                    driver_uuid TEXT PRIMARY KEY,
+                    channel_id INTEGER NOT NULL
+                )
+            ''')
+
             # Create indexes for performance
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_finished ON orders(order_finished_timestamp)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_driver ON orders(driver_uuid)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(order_status)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_payment ON orders(payment_method)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_state_logs_created ON state_logs_cache(created)')
 
             # Auto-migrate existing database if columns are missing
             self._ensure_columns_exist(cursor)
@@ -126,9 +243,13 @@ class FleetDatabase:
         all_columns = base_columns + optional_columns
         return ', '.join(all_columns)
 
-    async def sync_orders(self, bolt_client, full_sync: bool = False) -> Dict[str, Any]:
-        """Smart sync: Only fetch orders newer than our last sync"""
-        with sqlite3.connect(self.db_path) as conn:
+    async def sync_orders(self, bolt_client, full_sync: bool = False, batch_size: int = 500) -> Dict[str, Any]:
+        """Smart sync: Only fetch orders newer than our last sync.
+
+        Inserts are committed in batches of batch_size so a full sync pays
+        one fsync per batch instead of one per order.
+        """
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             # Get last sync point
@@ -146,21 +267,27 @@ class FleetDatabase:
                 else:
                     full_sync = True
 
+            # One clock read per sync; anything finishing after this lands
+            # in the next incremental sync
+            sync_started = datetime.now()
+
             if full_sync:
                 # Full sync - get last 30 days
-                start_date = datetime.now() - timedelta(days=30)
+                start_date = sync_started - timedelta(days=30)
                 logger.info("Full sync: fetching last 30 days")
 
             # Fetch from API
             new_orders = 0
             updated_orders = 0
             offset = 0
+            pending_in_batch = 0
+            earliest_changed_ts = None
 
             while True:
                 try:
                     response = await bolt_client.get_fleet_orders(
                         start_date=start_date,
-                        end_date=datetime.now(),
+                        end_date=sync_started,
                         limit=1000,
                         offset=offset
                     )
@@ -172,13 +299,25 @@ class FleetDatabase:
                     if not orders:
                         break
 
-                    # Store orders
+                    # Store orders, committing once per batch_size rows
                     for order in orders:
                         if self._store_order(conn, order):
                             new_orders += 1
                         else:
                             updated_orders += 1
 
+                        finished_ts = order.get('order_finished_timestamp')
+                        if finished_ts and (earliest_changed_ts is None or finished_ts < earliest_changed_ts):
+                            earliest_changed_ts = finished_ts
+
+                        pending_in_batch += 1
+                        if pending_in_batch >= batch_size:
+                            conn.commit()
+                            pending_in_batch = 0
+                            # Yield so heartbeats and commands can run
+                            # between batches of row processing
+                            await asyncio.sleep(0)
+
                     offset += len(orders)
 
                     # Safety limit for full sync
@@ -198,17 +337,27 @@ class FleetDatabase:
             cursor.execute('''
                 INSERT INTO sync_status (last_sync_timestamp, orders_synced)
                 VALUES (?, ?)
-            ''', (int(datetime.now().timestamp()), new_orders))
+            ''', (int(sync_started.timestamp()), new_orders))
             conn.commit()
 
             logger.info(f"Sync complete: {new_orders} new, {updated_orders} updated")
 
-            return {
-                'new_orders': new_orders,
-                'updated_orders': updated_orders,
-                'total_processed': new_orders + updated_orders,
-                'status': 'success'
-            }
+        # Refresh daily rollups for the days the sync touched; a large
+        # sync can rebuild hundreds of driver-days, so keep the queries
+        # and gap analysis in a worker thread instead of on the loop
+        if earliest_changed_ts:
+            try:
+                await asyncio.to_thread(self.update_daily_rollups, earliest_changed_ts)
+            except Exception as e:
+                logger.error(f"Failed to update daily rollups: {e}")
+
+        return {
+            'new_orders': new_orders,
+            'updated_orders': updated_orders,
+            'total_processed': new_orders + updated_orders,
+            'earliest_changed_ts': earliest_changed_ts,
+            'status': 'success'
+        }
 
     def _store_order(self, conn, order: Dict) -> bool:
         """Store a single order with all available timestamps"""
@@ -261,6 +410,69 @@ class FleetDatabase:
             logger.error(f"Failed to store order: {e}")
             return False
 
+    def update_daily_rollups(self, since_ts: int):
+        """Recompute per-driver daily aggregates for days touched by a sync.
+
+        Days are Romania-local to match how every report and calendar
+        period is defined. Called from sync_orders, off the command path.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT DISTINCT driver_uuid, order_finished_timestamp
+                FROM orders
+                WHERE order_status = 'finished'
+                AND order_finished_timestamp >= ?
+            ''', (since_ts,))
+
+            # Collect the (driver, local day) pairs that need a rebuild
+            pairs = set()
+            for driver_uuid, finished_ts in cursor.fetchall():
+                local_day = datetime.fromtimestamp(finished_ts, ROMANIA_TZ).date()
+                pairs.add((driver_uuid, local_day))
+
+            for driver_uuid, local_day in pairs:
+                day_start = datetime.combine(local_day, dt_time.min, tzinfo=ROMANIA_TZ)
+                day_end = day_start + timedelta(days=1)
+                start_ts = int(day_start.timestamp())
+                end_ts = int(day_end.timestamp())
+
+                cursor.execute('''
+                    SELECT 
+                        driver_name,
+                        COUNT(*),
+                        COALESCE(SUM(ride_price), 0),
+                        COALESCE(SUM(net_earnings), 0),
+                        COALESCE(SUM(CASE WHEN payment_method = 'cash' THEN net_earnings ELSE 0 END), 0),
+                        COALESCE(SUM(ride_distance) / 1000.0, 0)
+                    FROM orders
+                    WHERE driver_uuid = ?
+                    AND order_status = 'finished'
+                    AND order_finished_timestamp >= ?
+                    AND order_finished_timestamp < ?
+                ''', (driver_uuid, start_ts, end_ts))
+                row = cursor.fetchone()
+                if not row or row[1] == 0:
+                    cursor.execute(
+                        'DELETE FROM driver_daily_agg WHERE driver_uuid = ? AND day = ?',
+                        (driver_uuid, local_day.isoformat()))
+                    continue
+
+                active_hours = self.calculate_active_hours_from_orders(driver_uuid, start_ts, end_ts)
+                waiting_hours = self.calculate_waiting_hours_from_orders(driver_uuid, start_ts, end_ts)
+
+                cursor.execute('''
+                    INSERT OR REPLACE INTO driver_daily_agg
+                    (driver_uuid, day, driver_name, orders_completed, gross_earnings,
+                     net_earnings, cash_collected, total_distance, active_hours, waiting_hours)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (driver_uuid, local_day.isoformat(), row[0], row[1], row[2],
+                      row[3], row[4], row[5], active_hours, waiting_hours))
+
+            conn.commit()
+            if pairs:
+                logger.info(f"Updated daily rollups for {len(pairs)} driver-day(s)")
+
     def _calculate_working_hours_from_orders(self, order_times: List[Tuple]) -> float:
         """
         Calculate ACTIVE working hours (time engaged with customers) - SAFE VERSION
@@ -321,7 +533,7 @@ class FleetDatabase:
             return 0.0
 
         # Sort by timestamp
-        driver_logs.sort(key=lambda x: x.get('created', 0))
+        driver_logs.sort(key=_by_created)
 
         total_online_seconds = 0
         online_start = None
@@ -357,6 +569,126 @@ class FleetDatabase:
 
 
 
+    def get_fleet_daily_totals(self, day: date) -> Optional[Tuple[int, float, float, float, float]]:
+        """Fleet-wide totals for one Romania-local day from the rollups.
+
+        Returns (orders, gross, net, cash, km) in a single aggregate, or
+        None when no rollups exist for that day yet.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT 
+                    COALESCE(SUM(orders_completed), 0),
+                    COALESCE(SUM(gross_earnings), 0),
+                    COALESCE(SUM(net_earnings), 0),
+                    COALESCE(SUM(cash_collected), 0),
+                    COALESCE(SUM(total_distance), 0)
+                FROM driver_daily_agg
+                WHERE day = ?
+            ''', (day.isoformat(),))
+            row = cursor.fetchone()
+
+        if not row or row[0] == 0:
+            return None
+        return row
+
+    def get_top_drivers_for_day(self, day: date, limit: int = 5) -> List[Tuple[str, int, float]]:
+        """Top earners for one Romania-local day from the rollups.
+
+        Returns (driver_name, orders_completed, gross_earnings) tuples,
+        sorted by the database so Python never sorts the whole fleet.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT driver_name, orders_completed, gross_earnings
+                FROM driver_daily_agg
+                WHERE day = ?
+                ORDER BY gross_earnings DESC
+                LIMIT ?
+            ''', (day.isoformat(), limit))
+            return cursor.fetchall()
+
+    def get_top_drivers_by_gross(self, date: datetime, limit: int = 5) -> List[Tuple[str, int, float]]:
+        """Top earners for one day straight from the orders table.
+
+        Sorted and limited by SQLite; used when the daily rollups haven't
+        been built yet, so Python never ranks the whole fleet.
+        """
+        # Same Romania-local day window as get_driver_daily_stats
+        start_of_day = datetime(date.year, date.month, date.day, tzinfo=ROMANIA_TZ)
+        start_ts = int(start_of_day.timestamp())
+        end_ts = int((start_of_day + timedelta(days=1)).timestamp())
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT driver_name, COUNT(*), COALESCE(SUM(ride_price), 0) as gross
+                FROM orders
+                WHERE order_finished_timestamp >= ?
+                AND order_finished_timestamp < ?
+                AND order_status = 'finished'
+                GROUP BY driver_uuid
+                ORDER BY gross DESC
+                LIMIT ?
+            ''', (start_ts, end_ts, limit))
+            return cursor.fetchall()
+
+    def get_cached_state_logs(self, start_date: datetime, end_date: datetime) -> Optional[List[Dict]]:
+        """Return cached state logs covering [start_date, end_date), or None.
+
+        Only ranges previously fetched in full count as covered; partial
+        coverage returns None so the caller falls back to the API.
+        """
+        start_ts = int(start_date.timestamp())
+        end_ts = int(end_date.timestamp())
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    'SELECT 1 FROM state_log_coverage WHERE start_ts <= ? AND end_ts >= ? LIMIT 1',
+                    (start_ts, end_ts)
+                )
+                if not cursor.fetchone():
+                    return None
+
+                cursor.execute(
+                    'SELECT driver_uuid, created, state FROM state_logs_cache WHERE created BETWEEN ? AND ?',
+                    (start_ts, end_ts)
+                )
+                return [
+                    {'driver_uuid': driver_uuid, 'created': created, 'state': state}
+                    for driver_uuid, created, state in cursor.fetchall()
+                ]
+        except sqlite3.Error as e:
+            logger.warning(f"State log cache lookup failed: {e}")
+            return None
+
+    def cache_state_logs(self, start_date: datetime, end_date: datetime, state_logs: List[Dict]):
+        """Persist fetched state logs and record coverage for closed ranges"""
+        start_ts = int(start_date.timestamp())
+        end_ts = int(end_date.timestamp())
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    'INSERT OR IGNORE INTO state_logs_cache (driver_uuid, created, state) VALUES (?, ?, ?)',
+                    [(log.get('driver_uuid'), log.get('created'), log.get('state')) for log in state_logs]
+                )
+
+                # A range still in progress can grow more logs, so only
+                # fully elapsed ranges count as covered
+                if end_ts <= int(datetime.now().timestamp()):
+                    cursor.execute(
+                        'INSERT INTO state_log_coverage (start_ts, end_ts) VALUES (?, ?)',
+                        (start_ts, end_ts)
+                    )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to cache state logs: {e}")
+
     def get_fleet_stats(self, days: Optional[int] = None) -> Dict[str, Any]:
         """Get fleet statistics for specified days or all time"""
         with sqlite3.connect(self.db_path) as conn:
@@ -400,7 +732,52 @@ class FleetDatabase:
 
             return [(idx + 1, row[0], row[1]) for idx, row in enumerate(cursor.fetchall())]
 
-    def get_company_earnings_by_date_range(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+    def count_drivers(self) -> int:
+        """Count distinct drivers with a known name"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(DISTINCT driver_uuid)
+                FROM orders
+                WHERE driver_name IS NOT NULL
+            ''')
+            return cursor.fetchone()[0]
+
+    def get_drivers_page(self, limit: int, offset: int) -> List[Tuple[int, str, str]]:
+        """Get one page of drivers, keeping the global numbering across pages"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT DISTINCT driver_uuid, driver_name
+                FROM orders
+                WHERE driver_name IS NOT NULL
+                ORDER BY driver_name
+                LIMIT ? OFFSET ?
+            ''', (limit, offset))
+            return [(offset + idx + 1, row[0], row[1]) for idx, row in enumerate(cursor.fetchall())]
+
+    def get_driver_by_number(self, driver_number: int) -> Optional[Tuple[str, str]]:
+        """Get (driver_uuid, driver_name) for a 1-based driver number.
+
+        Avoids materializing the whole driver list when a command only
+        needs a single driver looked up by its list position.
+        """
+        if driver_number < 1:
+            return None
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT DISTINCT driver_uuid, driver_name
+                FROM orders
+                WHERE driver_name IS NOT NULL
+                ORDER BY driver_name
+                LIMIT 1 OFFSET ?
+            ''', (driver_number - 1,))
+            row = cursor.fetchone()
+            return (row[0], row[1]) if row else None
+
+    def get_company_earnings_by_date_range(self, start_date: datetime, end_date: datetime) -> CompanyStats:
         """Get company-wide earnings statistics for a specific date range"""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
@@ -460,19 +837,19 @@ class FleetDatabase:
                     'earnings': round(driver_row[3], 2)
                 })
 
-            return {
-                'trips_completed': trips,
-                'gross_earnings': round(row[1], 2),
-                'total_fees': round(row[2], 2),
-                'net_earnings': round(row[3], 2),
-                'total_distance': round(total_distance, 1),
-                'avg_distance': round(avg_distance, 1),
-                'earnings_per_trip': round(earnings_per_trip, 2),
-                'earnings_per_km': round(earnings_per_km, 2),
-                'avg_rating': round(row[5], 1) if row[5] > 0 else 0,
-                'cash_collected': round(row[6], 2),
-                'driver_breakdown': driver_breakdown
-            }
+            return CompanyStats(
+                trips_completed=trips,
+                gross_earnings=round(row[1], 2),
+                total_fees=round(row[2], 2),
+                net_earnings=round(row[3], 2),
+                total_distance=round(total_distance, 1),
+                avg_distance=round(avg_distance, 1),
+                earnings_per_trip=round(earnings_per_trip, 2),
+                earnings_per_km=round(earnings_per_km, 2),
+                avg_rating=round(row[5], 1) if row[5] > 0 else 0,
+                cash_collected=round(row[6], 2),
+                driver_breakdown=driver_breakdown
+            )
 
     def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
@@ -519,7 +896,7 @@ class FleetDatabase:
             }
 
         # Sort by timestamp
-        driver_logs.sort(key=lambda x: x.get('created', 0))
+        driver_logs.sort(key=_by_created)
 
         # Convert dates to timestamps for comparison
         start_ts = int(start_date.timestamp())
@@ -703,7 +1080,7 @@ class FleetDatabase:
             return {'total_online_hours': 0.0, 'waiting_hours': 0.0, 'active_hours': 0.0}
 
         # Sort by timestamp
-        driver_logs.sort(key=lambda x: x.get('created', 0))
+        driver_logs.sort(key=_by_created)
 
         # Track different time periods
         online_periods = []  # Tuples of (start_ts, end_ts, state_type)
@@ -761,43 +1138,20 @@ class FleetDatabase:
         }
 
     def get_driver_stats_by_uuid(self, driver_uuid: str, days: Optional[int] = None,
-                                 state_logs: Optional[List[Dict]] = None) -> Dict[str, Any]:
+                                 state_logs: Optional[List[Dict]] = None) -> Optional[DriverStats]:
         """Get detailed driver statistics with proper timezone handling"""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
 
-            # Use Romanian timezone
-            try:
-                romania_tz = pytz.timezone('Europe/Bucharest')
-            except:
-                # Fallback if pytz is not installed
-                romania_tz = None
+            # Today in Romania is the cache key; the range helper does the rest
+            today_local = datetime.now(ROMANIA_TZ).date()
+
+            start_date, end_date = _date_range_for_days(days, today_local)
+            start_ts = int(start_date.timestamp())
+            end_ts = int(end_date.timestamp())
 
             # Build query based on days parameter
             if days:
-                if romania_tz:
-                    # Get current time in Romania
-                    now_romania = datetime.now(romania_tz)
-
-                    # For "1 day", we want TODAY only (from midnight to now)
-                    # For "2 days", we want YESTERDAY and TODAY
-                    # Start date is X days ago at midnight
-                    start_date = now_romania.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(
-                        days=days - 1)
-                    end_date = now_romania  # Current moment
-
-                    # Remove timezone info for timestamp conversion
-                    start_date = start_date.replace(tzinfo=None)
-                    end_date = end_date.replace(tzinfo=None)
-                else:
-                    # Fallback without timezone
-                    now = datetime.now()
-                    start_date = datetime(now.year, now.month, now.day) - timedelta(days=days - 1)
-                    end_date = now
-
-                start_ts = int(start_date.timestamp())
-                end_ts = int(end_date.timestamp())
-
                 time_filter = "AND order_finished_timestamp >= ? AND order_finished_timestamp <= ?"
                 params = (driver_uuid, start_ts, end_ts)
 
@@ -809,13 +1163,6 @@ class FleetDatabase:
                 else:
                     date_range = f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d')}"
             else:
-                # All time - use company start date
-                start_date = datetime(2024, 7, 28, 0, 0, 0)
-                end_date = datetime.now()
-
-                start_ts = int(start_date.timestamp())
-                end_ts = int(end_date.timestamp())
-
                 time_filter = ""
                 params = (driver_uuid,)
                 date_range = "All Time"
@@ -887,35 +1234,50 @@ class FleetDatabase:
             earnings_per_km = row[2] / row[4] if row[4] > 0 else 0
             avg_distance = row[4] / row[1] if row[1] > 0 else 0
 
-            return {
-                'driver_name': row[0],
-                'orders_completed': row[1],
-                'gross_earnings': round(row[2], 2),
-                'net_earnings': round(row[3], 2),
-                'total_distance': round(row[4], 1),
-                'hours_worked': total_online_hours,  # Total online time
-                'ride_hours': ride_hours,  # Time on rides
-                'waiting_hours': waiting_hours,  # Time waiting for orders
-                'earnings_per_hour': round(earnings_per_hour, 2),
-                'earnings_per_km': round(earnings_per_km, 2),
-                'avg_distance': round(avg_distance, 1),
-                'cash_collected': round(row[5], 2),
-                'date_range': date_range
-            }
-
-    def get_driver_daily_stats(self, date: datetime) -> List[Dict[str, Any]]:
-        """Get daily statistics for each driver based on order finished timestamp"""
+            return DriverStats(
+                driver_name=row[0],
+                orders_completed=row[1],
+                gross_earnings=round(row[2], 2),
+                net_earnings=round(row[3], 2),
+                total_distance=round(row[4], 1),
+                hours_worked=total_online_hours,  # Total online time
+                ride_hours=ride_hours,  # Time on rides
+                waiting_hours=waiting_hours,  # Time waiting for orders
+                earnings_per_hour=round(earnings_per_hour, 2),
+                earnings_per_km=round(earnings_per_km, 2),
+                avg_distance=round(avg_distance, 1),
+                cash_collected=round(row[5], 2),
+                date_range=date_range
+            )
+
+    def get_driver_daily_stats(self, date: datetime,
+                               driver_uuids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get daily statistics for each driver based on order finished timestamp.
+
+        driver_uuids optionally restricts the aggregation to a subset of
+        drivers at the SQL layer, so callers that only care about e.g.
+        channel-mapped drivers don't pull the whole fleet.
+        """
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
 
-            # Calculate start and end of day timestamps
-            start_of_day = datetime(date.year, date.month, date.day, 0, 0, 0)
+            # Romania-local day bounds, matching the rollups and reports;
+            # a naive datetime here would resolve in the host timezone and
+            # shift the window by the UTC offset
+            start_of_day = datetime(date.year, date.month, date.day, tzinfo=ROMANIA_TZ)
             end_of_day = start_of_day + timedelta(days=1) - timedelta(seconds=1)
             start_ts = int(start_of_day.timestamp())
             end_ts = int(end_of_day.timestamp())
 
+            uuid_filter = ''
+            params = [start_ts, end_ts]
+            if driver_uuids is not None:
+                placeholders = ','.join('?' * len(driver_uuids))
+                uuid_filter = f'AND driver_uuid IN ({placeholders})'
+                params.extend(driver_uuids)
+
             # Get stats grouped by driver
-            cursor.execute('''
+            cursor.execute(f'''
                 SELECT 
                     driver_uuid,
                     driver_name,
@@ -923,13 +1285,18 @@ class FleetDatabase:
                     COALESCE(SUM(ride_price), 0) as gross_earnings,
                     COALESCE(SUM(net_earnings), 0) as net_earnings,
                     COALESCE(SUM(ride_distance) / 1000.0, 0) as kms_traveled,
-                    COALESCE(SUM(CASE WHEN payment_method = 'cash' THEN net_earnings ELSE 0 END), 0) as cash_collected
+                    COALESCE(SUM(CASE WHEN payment_method = 'cash' THEN net_earnings ELSE 0 END), 0) as cash_collected,
+                    COALESCE(SUM(ride_price), 0) / COUNT(*) as earnings_per_order,
+                    CASE WHEN COALESCE(SUM(ride_distance), 0) > 0
+                         THEN COALESCE(SUM(ride_price), 0) / (SUM(ride_distance) / 1000.0)
+                         ELSE 0 END as earnings_per_km
                 FROM orders
                 WHERE order_finished_timestamp >= ? 
                 AND order_finished_timestamp <= ?
                 AND order_status = 'finished'
+                {uuid_filter}
                 GROUP BY driver_uuid
-            ''', (start_ts, end_ts))
+            ''', params)
 
             results = []
             driver_data = cursor.fetchall()
@@ -966,17 +1333,74 @@ class FleetDatabase:
                     'kms_traveled': round(row[5], 1),
                     'cash_collected': round(row[6], 2),
                     'hours_worked': round(hours_worked, 1),
-                    'earnings_per_hour': round(earnings_per_hour, 2)
+                    'earnings_per_hour': round(earnings_per_hour, 2),
+                    # Ratios come straight from the aggregate so the report
+                    # loops don't repeat the divisions (or their zero guards)
+                    'earnings_per_order': round(row[7], 2),
+                    'earnings_per_km': round(row[8], 2)
                 })
 
             return results
 
+    def get_driver_channels(self) -> Dict[str, int]:
+        """Load all driver report channel mappings"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT driver_uuid, channel_id FROM driver_channels')
+            return dict(cursor.fetchall())
+
+    def set_driver_channel(self, driver_uuid: str, channel_id: int):
+        """Upsert one driver's report channel mapping"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''
+                INSERT INTO driver_channels (driver_uuid, channel_id)
+                VALUES (?, ?)
+                ON CONFLICT(driver_uuid) DO UPDATE SET channel_id = excluded.channel_id
+            ''', (driver_uuid, channel_id))
+            conn.commit()
+
+    def set_driver_channels(self, mapping: Dict[str, int]):
+        """Bulk upsert mappings (used once to migrate the old JSON file)"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany('''
+                INSERT INTO driver_channels (driver_uuid, channel_id)
+                VALUES (?, ?)
+                ON CONFLICT(driver_uuid) DO UPDATE SET channel_id = excluded.channel_id
+            ''', list(mapping.items()))
+            conn.commit()
+
+    def get_driver_order_count(self, driver_uuid: str, start_date: datetime, end_date: datetime) -> int:
+        """Cheap COUNT of a driver's finished orders in a UTC period.
+
+        Used to bail out of stats requests before paying for the state-log
+        API fetch when the period is empty.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(*)
+                FROM orders
+                WHERE driver_uuid = ?
+                AND order_status = 'finished'
+                AND order_finished_timestamp >= ?
+                AND order_finished_timestamp < ?
+            ''', (driver_uuid, int(start_date.timestamp()), int(end_date.timestamp())))
+            return cursor.fetchone()[0]
+
     def get_driver_stats_by_date_range(self, driver_uuid: str, start_date: datetime, end_date: datetime,
                                                 state_logs: Optional[List[Dict]] = None) -> Dict[str, Any]:
         """
         Get detailed driver statistics with complete time tracking.
         Calculates both active hours and waiting hours accurately.
         """
+        # Ranges beyond the state-log window never carry logs; serve them
+        # from the daily rollups when available (a year view sums ~365
+        # rollup rows instead of re-aggregating every order)
+        if not state_logs and (end_date - start_date).days > 31:
+            rollup_stats = self._stats_from_daily_rollups(driver_uuid, start_date, end_date)
+            if rollup_stats is not None:
+                return rollup_stats
+
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
 
@@ -1079,6 +1503,87 @@ class FleetDatabase:
                 'date_range': date_range
             }
 
+    def _stats_from_daily_rollups(self, driver_uuid: str, start_date: datetime,
+                                  end_date: datetime) -> Optional[Dict[str, Any]]:
+        """Sum driver_daily_agg rows for the range, or None if not built yet"""
+        if start_date.tzinfo is not None:
+            start_day = start_date.astimezone(ROMANIA_TZ).date()
+            end_day = end_date.astimezone(ROMANIA_TZ).date()
+        else:
+            start_day = start_date.date()
+            end_day = end_date.date()
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT 
+                    MAX(driver_name),
+                    COALESCE(SUM(orders_completed), 0),
+                    COALESCE(SUM(gross_earnings), 0),
+                    COALESCE(SUM(net_earnings), 0),
+                    COALESCE(SUM(total_distance), 0),
+                    COALESCE(SUM(cash_collected), 0),
+                    COALESCE(SUM(active_hours), 0),
+                    COALESCE(SUM(waiting_hours), 0)
+                FROM driver_daily_agg
+                WHERE driver_uuid = ?
+                AND day >= ? AND day < ?
+            ''', (driver_uuid, start_day.isoformat(), end_day.isoformat()))
+
+            row = cursor.fetchone()
+
+            if not row or row[1] == 0:
+                # Rollups not populated for this range yet; caller falls
+                # back to row-level aggregation
+                return None
+
+            # Rollups only exist for days touched by a sync since the
+            # table was introduced, so a long range on an existing
+            # database can be partially covered. A cheap indexed COUNT
+            # over the same window catches that: any mismatch means the
+            # sums are incomplete and the row scan must run instead.
+            start_ts = int(datetime.combine(start_day, dt_time.min, tzinfo=ROMANIA_TZ).timestamp())
+            end_ts = int(datetime.combine(end_day, dt_time.min, tzinfo=ROMANIA_TZ).timestamp())
+            cursor.execute('''
+                SELECT COUNT(*)
+                FROM orders
+                WHERE driver_uuid = ?
+                AND order_status = 'finished'
+                AND order_finished_timestamp >= ?
+                AND order_finished_timestamp < ?
+            ''', (driver_uuid, start_ts, end_ts))
+            if cursor.fetchone()[0] != row[1]:
+                return None
+
+        active_hours = round(row[6], 2)
+        waiting_hours = round(row[7], 2)
+        total_online_hours = round(active_hours + waiting_hours, 2)
+
+        earnings_per_hour_total = row[2] / total_online_hours if total_online_hours > 0 else 0
+        earnings_per_hour_active = row[2] / active_hours if active_hours > 0 else 0
+        earnings_per_km = row[2] / row[4] if row[4] > 0 else 0
+        avg_distance = row[4] / row[1] if row[1] > 0 else 0
+
+        end_display = end_date - timedelta(seconds=1)
+        date_range = f"{start_date.strftime('%b %d')} - {end_display.strftime('%b %d, %Y')}"
+
+        return {
+            'driver_name': row[0],
+            'orders_completed': row[1],
+            'gross_earnings': round(row[2], 2),
+            'net_earnings': round(row[3], 2),
+            'total_distance': round(row[4], 1),
+            'hours_worked': active_hours,
+            'waiting_hours': waiting_hours,
+            'total_online_hours': total_online_hours,
+            'earnings_per_hour': round(earnings_per_hour_total, 2),
+            'earnings_per_hour_active': round(earnings_per_hour_active, 2),
+            'earnings_per_km': round(earnings_per_km, 2),
+            'avg_distance': round(avg_distance, 1),
+            'cash_collected': round(row[5], 2),
+            'date_range': date_range
+        }
+
     def calculate_active_hours_from_orders(self, driver_uuid: str, start_ts: int, end_ts: int) -> float:
         """
         Calculate ACTIVE hours by summing individual ride durations.
@@ -1090,11 +1595,9 @@ class FleetDatabase:
             # Get all finished orders - use order_finished_timestamp for date filtering
             # This ensures rides are counted in the day they finished (as you specified)
             cursor.execute('''
-                SELECT 
+                SELECT
                     order_accepted_timestamp,
                     order_finished_timestamp,
-                    order_pickup_timestamp,
-                    order_drop_off_timestamp,
                     order_reference,
                     ride_distance
                 FROM orders
@@ -1107,59 +1610,52 @@ class FleetDatabase:
                 ORDER BY order_accepted_timestamp
             ''', (driver_uuid, start_ts, end_ts))
 
-            orders = cursor.fetchall()
+            return self._active_hours_from_rows(cursor.fetchall())
 
-            if not orders:
-                return 0.0
+    @staticmethod
+    def _active_hours_from_rows(orders: List[Tuple]) -> float:
+        """Sum ride durations from (accepted, finished, reference, distance) rows"""
+        if not orders:
+            return 0.0
+
+        total_active_seconds = 0
+
+        for accepted, finished, reference, distance in orders:
+            if accepted and finished and finished > accepted:
+                # Calculate ride duration
+                ride_duration = finished - accepted
+
+                # More refined sanity checks based on distance
+                # Average speed shouldn't exceed 60 km/h in city driving
+                if distance and distance > 0:
+                    # Convert distance from meters to km
+                    distance_km = distance / 1000.0
+                    # Minimum reasonable time for this distance (at 60 km/h average)
+                    min_time = (distance_km / 60) * 3600  # in seconds
+                    # Maximum reasonable time (at 10 km/h average - heavy traffic)
+                    max_time = (distance_km / 10) * 3600  # in seconds
+
+                    # Apply constraints
+                    if ride_duration < min_time:
+                        logger.debug(
+                            f"Order {reference}: Duration {ride_duration}s seems too short for {distance_km}km")
+                        ride_duration = min_time
+                    elif ride_duration > max_time:
+                        logger.debug(
+                            f"Order {reference}: Duration {ride_duration}s seems too long for {distance_km}km")
+                        ride_duration = max_time
+                else:
+                    # No distance data - apply general cap of 2 hours
+                    ride_duration = min(ride_duration, 2 * 3600)
+
+                total_active_seconds += ride_duration
+
+        # Round to match Bolt's precision (they show hours and minutes)
+        # Convert to hours and minutes, then back to decimal
+        total_minutes = round(total_active_seconds / 60)
+        active_hours = total_minutes / 60
 
-            total_active_seconds = 0
-
-            for order in orders:
-                accepted = order[0]
-                finished = order[1]
-                pickup = order[2]
-                dropoff = order[3]
-                reference = order[4]
-                distance = order[5]
-
-                if accepted and finished and finished > accepted:
-                    # Calculate ride duration
-                    ride_duration = finished - accepted
-
-                    # More refined sanity checks based on distance
-                    # Average speed shouldn't exceed 60 km/h in city driving
-                    if distance and distance > 0:
-                        # Convert distance from meters to km
-                        distance_km = distance / 1000.0
-                        # Minimum reasonable time for this distance (at 60 km/h average)
-                        min_time = (distance_km / 60) * 3600  # in seconds
-                        # Maximum reasonable time (at 10 km/h average - heavy traffic)
-                        max_time = (distance_km / 10) * 3600  # in seconds
-
-                        # Apply constraints
-                        if ride_duration < min_time:
-                            logger.debug(
-                                f"Order {reference}: Duration {ride_duration}s seems too short for {distance_km}km")
-                            ride_duration = min_time
-                        elif ride_duration > max_time:
-                            logger.debug(
-                                f"Order {reference}: Duration {ride_duration}s seems too long for {distance_km}km")
-                            ride_duration = max_time
-                    else:
-                        # No distance data - apply general cap of 2 hours
-                        ride_duration = min(ride_duration, 2 * 3600)
-
-                    total_active_seconds += ride_duration
-
-            # Convert to hours with 2 decimal precision
-            active_hours = total_active_seconds / 3600
-
-            # Round to match Bolt's precision (they show hours and minutes)
-            # Convert to hours and minutes, then back to decimal
-            total_minutes = round(total_active_seconds / 60)
-            active_hours = total_minutes / 60
-
-            return round(active_hours, 2)
+        return round(active_hours, 2)
 
     def calculate_waiting_hours_from_orders(self, driver_uuid: str, start_ts: int, end_ts: int) -> float:
         """
@@ -1184,32 +1680,108 @@ class FleetDatabase:
                 ORDER BY order_accepted_timestamp
             ''', (driver_uuid, start_ts, end_ts))
 
-            orders = cursor.fetchall()
+            return self._waiting_hours_from_rows(cursor.fetchall())
 
-            if len(orders) <= 1:
-                return 0.0  # No waiting time with 0 or 1 order
+    @staticmethod
+    def _waiting_hours_from_rows(orders: List[Tuple]) -> float:
+        """Estimate waiting hours from gaps between consecutive order rows.
 
-            total_waiting_seconds = 0
+        Rows must start with (accepted, finished, ...) and be sorted by
+        acceptance time.
+        """
+        if len(orders) <= 1:
+            return 0.0  # No waiting time with 0 or 1 order
+
+        total_waiting_seconds = 0
+
+        # Calculate gaps between consecutive orders
+        for i in range(1, len(orders)):
+            prev_finished = orders[i - 1][1]
+            curr_accepted = orders[i][0]
+
+            gap = curr_accepted - prev_finished
+
+            if gap > 0:
+                # Consider gaps up to 30 minutes as waiting time
+                # Longer gaps are likely breaks/offline periods
+                if gap <= 1800:  # 30 minutes
+                    total_waiting_seconds += gap
+                elif gap <= 3600:  # 1 hour
+                    # For gaps 30-60 minutes, count partial waiting time
+                    total_waiting_seconds += 1800  # Count max 30 minutes
+                # Gaps over 1 hour are considered offline time
+
+        # Convert to hours with proper rounding
+        total_minutes = round(total_waiting_seconds / 60)
+        waiting_hours = total_minutes / 60
+
+        return round(waiting_hours, 2)
+
+    def get_daily_hours_bulk(self, start_date: datetime, end_date: datetime,
+                             logs_by_driver: Optional[Dict[str, List[Dict]]] = None
+                             ) -> Dict[str, Dict[str, float]]:
+        """Compute active/waiting/online hours for every driver in one query.
+
+        The nightly report used to call get_driver_stats_by_date_range per
+        driver — up to three queries each. One fetch of the day's finished
+        orders, bucketed by driver, feeds the same duration and gap logic,
+        with state logs (pre-grouped by the caller) taking precedence for
+        waiting time exactly as in the per-driver path.
+        """
+        start_ts = int(start_date.timestamp())
+        end_ts = int(end_date.timestamp())
+        logs_by_driver = logs_by_driver or {}
 
-            # Calculate gaps between consecutive orders
-            for i in range(1, len(orders)):
-                prev_finished = orders[i - 1][1]
-                curr_accepted = orders[i][0]
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT
+                    driver_uuid,
+                    order_accepted_timestamp,
+                    order_finished_timestamp,
+                    order_reference,
+                    ride_distance
+                FROM orders
+                WHERE order_status = 'finished'
+                AND order_finished_timestamp >= ?
+                AND order_finished_timestamp < ?
+                AND order_accepted_timestamp IS NOT NULL
+                AND order_finished_timestamp IS NOT NULL
+                ORDER BY driver_uuid, order_accepted_timestamp
+            ''', (start_ts, end_ts))
+
+            rows_by_driver: Dict[str, List[Tuple]] = {}
+            for driver_uuid, *row in cursor.fetchall():
+                rows_by_driver.setdefault(driver_uuid, []).append(tuple(row))
+
+        hours_by_driver = {}
+        for driver_uuid, rows in rows_by_driver.items():
+            active_hours = self._active_hours_from_rows(rows)
+
+            waiting_hours = 0.0
+            driver_logs = logs_by_driver.get(driver_uuid, [])
+            if driver_logs:
+                states_in_logs = set(
+                    log.get('state', '').lower() for log in driver_logs
+                )
+                if 'waiting_orders' in states_in_logs:
+                    hours_data = self.calculate_hours_from_states(
+                        driver_uuid, start_date, end_date, driver_logs
+                    )
+                    waiting_hours = hours_data.get('waiting_hours', 0)
 
-                gap = curr_accepted - prev_finished
+                    # If state logs show close active hours, prefer them
+                    state_active = hours_data.get('ride_hours', 0)
+                    if state_active > 0 and abs(state_active - active_hours) < 2:
+                        active_hours = state_active
 
-                if gap > 0:
-                    # Consider gaps up to 30 minutes as waiting time
-                    # Longer gaps are likely breaks/offline periods
-                    if gap <= 1800:  # 30 minutes
-                        total_waiting_seconds += gap
-                    elif gap <= 3600:  # 1 hour
-                        # For gaps 30-60 minutes, count partial waiting time
-                        total_waiting_seconds += 1800  # Count max 30 minutes
-                    # Gaps over 1 hour are considered offline time
+            if waiting_hours == 0:
+                waiting_hours = self._waiting_hours_from_rows(rows)
 
-            # Convert to hours with proper rounding
-            total_minutes = round(total_waiting_seconds / 60)
-            waiting_hours = total_minutes / 60
+            hours_by_driver[driver_uuid] = {
+                'hours_worked': active_hours,
+                'waiting_hours': waiting_hours,
+                'total_online_hours': round(active_hours + waiting_hours, 2),
+            }
 
-            return round(waiting_hours, 2)
\ No newline at end of file
+        return hours_by_driver
\ No newline at end of file
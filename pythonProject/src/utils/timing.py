@@ -0,0 +1,56 @@
+import contextvars
+import functools
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Per-command accumulator for sub-timings, installed by @timed
+_timings = contextvars.ContextVar('command_timings', default=None)
+
+
+class track:
+    """Context manager attributing elapsed time to a category.
+
+    Used inside a @timed handler to split total latency into db/api time:
+
+        with track('db'):
+            stats = self.bolt_client.db.get_fleet_stats()
+    """
+
+    def __init__(self, category: str):
+        self.category = category
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        timings = _timings.get()
+        if timings is not None:
+            elapsed = time.perf_counter_ns() - self._start
+            timings[self.category] = timings.get(self.category, 0) + elapsed
+
+
+def timed(func):
+    """Log structured latency for a coroutine handler when it completes.
+
+    Emits one line per invocation, e.g.
+    ⏱️ FleetCommands.fleet_stats db=12ms total=45ms
+    so we can tell whether Bolt HTTP, SQLite, or Discord sends dominate.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        timings = {}
+        token = _timings.set(timings)
+        start = time.perf_counter_ns()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            total_ms = (time.perf_counter_ns() - start) // 1_000_000
+            _timings.reset(token)
+            parts = ''.join(f" {k}={v // 1_000_000}ms" for k, v in timings.items())
+            logger.info("⏱️ %s%s total=%dms", func.__qualname__, parts, total_ms)
+
+    return wrapper